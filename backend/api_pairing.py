@@ -2,9 +2,13 @@
 Pairing and Device Information API
 Provides endpoints for device pairing and discovery
 """
-from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi import APIRouter, HTTPException, Depends, Header, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
+import asyncio
+import hashlib
+import time
 import uuid
 import platform
 import socket
@@ -20,7 +24,11 @@ router = APIRouter(prefix="/api/device", tags=["Device & Pairing"])
 # ═══════════════════════════════════════════════════════════════════
 
 class DeviceInfoResponse(BaseModel):
-    """Device information for discovery"""
+    """Device information for discovery.
+
+    Documents the /info wire shape; the endpoint itself returns a
+    prebuilt dict via ORJSONResponse (see _DEVICE_INFO_BASE) instead of
+    constructing this model per request."""
     name: str
     model: str
     hardware_id: str
@@ -91,15 +99,114 @@ def get_hardware_id() -> str:
     return settings.HARDWARE_ID
 
 
-async def verify_auth_token(authorization: Optional[str] = Header(None)) -> PairedDevice:
+# Host identity is constant for the process lifetime; resolve it once at
+# import instead of per request. The local IP lookup in particular opens
+# a UDP socket and connect()s - a blocking syscall that has no business
+# on the event loop inside an async handler.
+_HOSTNAME = socket.gethostname()
+_PLATFORM = platform.system()
+_HARDWARE_ID = get_hardware_id()
+_LOCAL_IP = get_local_ip()
+_LOCAL_IP_REFRESHED = time.monotonic()
+_LOCAL_IP_TTL = 60.0
+
+
+async def _local_ip() -> str:
+    """Cached local IP, re-resolved off-loop when older than the TTL
+    (catches interface changes without a per-request syscall)."""
+    global _LOCAL_IP, _LOCAL_IP_REFRESHED
+    now = time.monotonic()
+    if now - _LOCAL_IP_REFRESHED >= _LOCAL_IP_TTL:
+        _LOCAL_IP_REFRESHED = now
+        _LOCAL_IP = await asyncio.to_thread(get_local_ip)
+    return _LOCAL_IP
+
+
+# All the constant /info fields, built once; per request only local_ip
+# and pairing_required get overlaid. Shape documented by
+# DeviceInfoResponse above.
+_DEVICE_INFO_BASE = {
+    "name": settings.DEVICE_NAME,
+    "model": settings.DEVICE_MODEL,
+    "hardware_id": _HARDWARE_ID,
+    "version": "1.0.0",
+    "hostname": _HOSTNAME,
+    "platform": _PLATFORM,
+}
+
+
+# Verified-token cache. pairing_manager.verify_token rewrites the
+# paired-devices JSON on every hit (to bump last_seen), so repeat
+# requests with the same bearer token were paying a disk write each.
+# Keys are blake2b digests rather than the raw tokens so the cache
+# never holds live credentials. Positive results only; TTL bounds how
+# long an out-of-band unpair (CLI runs in a separate process) can lag.
+_TOKEN_CACHE: Dict[bytes, Tuple[PairedDevice, float]] = {}
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAX = 1024
+
+
+def _extract_bearer(authorization: Optional[str]) -> Optional[str]:
+    """Pull the token out of a 'Bearer <token>' header.
+
+    Prefix check + slice instead of str.replace: O(1) on the scheme
+    rather than a full scan of an attacker-sized header, and it no
+    longer mangles tokens that happen to contain 'Bearer '.
+    """
+    if authorization and authorization.startswith("Bearer "):
+        return authorization[7:].strip()
+    return None
+
+
+async def _resolve_device(token: str) -> Optional[PairedDevice]:
+    """Verify a bearer token, serving repeat lookups from the TTL cache.
+
+    Cache hits stay on the loop (pure dict work); misses run the
+    manager's verify - which rewrites the devices file - in the thread
+    pool so the file I/O never stalls other requests or WS traffic.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.monotonic()
+    hit = _TOKEN_CACHE.get(key)
+    if hit is not None and now - hit[1] < _TOKEN_CACHE_TTL:
+        return hit[0]
+
+    device = await asyncio.to_thread(pairing_manager.verify_token, token)
+    if device is not None:
+        if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX:
+            _TOKEN_CACHE.clear()
+        _TOKEN_CACHE[key] = (device, now)
+    elif hit is not None:
+        # Token went invalid; drop the stale entry early
+        del _TOKEN_CACHE[key]
+    return device
+
+
+async def optional_auth_token(
+    request: Request, authorization: Optional[str] = Header(None)
+) -> Optional[PairedDevice]:
+    """Dependency resolving the caller's paired device, or None.
+
+    FastAPI memoizes dependency results within a request, so any number
+    of sub-dependencies layered on this one (role checks, audit,
+    rate limits) share a single token verification. The device is also
+    stashed on request.state.device for non-dependency consumers like
+    logging middleware.
+    """
+    token = _extract_bearer(authorization)
+    device = await _resolve_device(token) if token else None
+    request.state.device = device
+    return device
+
+
+async def verify_auth_token(
+    authorization: Optional[str] = Header(None),
+    device: Optional[PairedDevice] = Depends(optional_auth_token, use_cache=True),
+) -> PairedDevice:
     """Dependency to verify authentication token"""
-    if not authorization:
+    if not _extract_bearer(authorization):
         raise HTTPException(status_code=401, detail="No authorization header")
 
-    # Extract token from "Bearer <token>"
-    token = authorization.replace("Bearer ", "").strip()
-
-    device = pairing_manager.verify_token(token)
     if not device:
         raise HTTPException(status_code=403, detail="Invalid or expired token")
 
@@ -110,8 +217,10 @@ async def verify_auth_token(authorization: Optional[str] = Header(None)) -> Pair
 # Public Endpoints (No Auth Required)
 # ═══════════════════════════════════════════════════════════════════
 
-@router.get("/info", response_model=DeviceInfoResponse)
-async def get_device_info(authorization: Optional[str] = Header(None)):
+@router.get("/info")
+async def get_device_info(
+    device: Optional[PairedDevice] = Depends(optional_auth_token, use_cache=True),
+):
     """
     Get device information for discovery.
     This endpoint is public so frontends can discover and identify devices.
@@ -119,27 +228,17 @@ async def get_device_info(authorization: Optional[str] = Header(None)):
     If an Authorization header is provided, checks if THIS specific device is paired.
     If no Authorization header, assumes new device and returns pairing_required=True.
     """
-    # Check if this specific device is paired (based on token)
-    pairing_required = True  # Default: assume pairing needed
-
-    if authorization:
-        # Extract token from "Bearer <token>"
-        token = authorization.replace("Bearer ", "").strip()
-        device = pairing_manager.verify_token(token)
-        if device:
-            # This device has a valid pairing token, no pairing needed
-            pairing_required = False
-
-    return DeviceInfoResponse(
-        name=settings.DEVICE_NAME,
-        model=settings.DEVICE_MODEL,
-        hardware_id=get_hardware_id(),
-        version="1.0.0",
-        local_ip=get_local_ip(),
-        hostname=socket.gethostname(),
-        platform=platform.system(),
-        pairing_required=pairing_required
-    )
+    # Paired devices (valid token resolved by the shared dependency)
+    # don't need pairing again
+    pairing_required = device is None
+
+    # Dict overlay + orjson: no per-request Pydantic construction or
+    # outbound re-validation for a payload that is almost all constants
+    return ORJSONResponse({
+        **_DEVICE_INFO_BASE,
+        "local_ip": await _local_ip(),
+        "pairing_required": pairing_required,
+    })
 
 
 @router.post("/pair", response_model=PairDeviceResponse)
@@ -148,7 +247,10 @@ async def pair_device(request: PairDeviceRequest):
     Pair a new device using a pairing code.
     Returns an authentication token that should be stored by the client.
     """
-    token = pairing_manager.pair_device(
+    # pair_device reloads and rewrites both pairing-state files; run it
+    # in the thread pool so concurrent pairings don't serialize the loop
+    token = await asyncio.to_thread(
+        pairing_manager.pair_device,
         code=request.pairing_code,
         device_name=request.device_name,
         device_type=request.device_type
@@ -160,6 +262,9 @@ async def pair_device(request: PairDeviceRequest):
             detail="Invalid pairing code or pairing mode not active"
         )
 
+    # New pairing may coincide with device-list changes; start clean
+    _TOKEN_CACHE.clear()
+
     return PairDeviceResponse(
         token=token,
         message=f"Device '{request.device_name}' paired successfully"
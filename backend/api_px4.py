@@ -1,5 +1,10 @@
 # backend/api_px4.py
+import asyncio
+import time
+from typing import Optional, Tuple
+
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 from backend.supervisor import supervisor
 from backend.config import settings
 from backend.models import (
@@ -11,6 +16,12 @@ from backend.auth.dep import require_roles
 
 router = APIRouter(prefix="/px4", tags=["PX4 / Scenarios"])
 
+# One control command in flight at a time: there is a single physical
+# drone behind these endpoints, and concurrent arm/takeoff/offboard
+# calls race MAVSDK state into failed commands and retry storms. Status
+# reads stay lock-free.
+_PX4_LOCK = asyncio.Semaphore(1)
+
 
 # --- tiny helper to broadcast WS/status without exploding if not wired -------
 def _ws(payload: dict):
@@ -21,6 +32,19 @@ def _ws(payload: dict):
         pass
 
 
+# /px4/status is dashboard-polled at up to 10 Hz per client; one cached
+# dump serves every poll inside a 100ms window instead of N attribute
+# walks + Pydantic constructions. Mutating endpoints invalidate it so a
+# state change is never reported stale.
+_STATUS_CACHE: Optional[Tuple[float, dict]] = None
+_STATUS_CACHE_TTL = 0.1
+
+
+def _invalidate_status_cache():
+    global _STATUS_CACHE
+    _STATUS_CACHE = None
+
+
 def _px4_status_safe() -> PX4StatusResponse:
     s = getattr(supervisor, "px4", None)
     s = getattr(s, "status", None)
@@ -44,7 +68,9 @@ def _px4_status_safe() -> PX4StatusResponse:
 @router.post("/connect", response_model=PX4ConnectResponse)
 async def px4_connect():
     try:
-        await supervisor.px4_connect()  # fast connect (≤3s) after your controller changes
+        async with _PX4_LOCK:
+            await supervisor.px4_connect()  # fast connect (≤3s) after your controller changes
+        _invalidate_status_cache()
         s = _px4_status_safe()
         return PX4ConnectResponse(
             connected=s.connected,
@@ -54,19 +80,27 @@ async def px4_connect():
         raise HTTPException(status_code=500, detail=f"PX4 connect failed: {e}")
 
 
-@router.get("/status", response_model=PX4StatusResponse)
+@router.get("/status")
 async def px4_status():
-    return _px4_status_safe()
+    global _STATUS_CACHE
+    now = time.monotonic()
+    if _STATUS_CACHE is not None and now - _STATUS_CACHE[0] < _STATUS_CACHE_TTL:
+        return ORJSONResponse(_STATUS_CACHE[1])
+    payload = _px4_status_safe().model_dump()
+    _STATUS_CACHE = (now, payload)
+    return ORJSONResponse(payload)
 
 
 @router.post("/arm")
 async def px4_arm(req: PX4ArmRequest, user=Depends(require_roles("DEVELOPER","ADMIN"))):
     try:
-        await supervisor.px4_connect()
-        if req.arm:
-            await supervisor.px4.arm()
-        else:
-            await supervisor.px4.disarm()
+        async with _PX4_LOCK:
+            await supervisor.px4_connect()
+            if req.arm:
+                await supervisor.px4.arm()
+            else:
+                await supervisor.px4.disarm()
+        _invalidate_status_cache()
         return {"armed": supervisor.px4.status.armed}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Arm/disarm failed: {e}")
@@ -75,7 +109,9 @@ async def px4_arm(req: PX4ArmRequest, user=Depends(require_roles("DEVELOPER","AD
 @router.post("/takeoff")
 async def px4_takeoff(req: PX4TakeoffRequest, user=Depends(require_roles("DEVELOPER","ADMIN"))):
     try:
-        await supervisor.px4_takeoff(req.altitude_m)  # returns when airborne (not full alt)
+        async with _PX4_LOCK:
+            await supervisor.px4_takeoff(req.altitude_m)  # returns when airborne (not full alt)
+        _invalidate_status_cache()
         return {"ok": True, "altitude_m": req.altitude_m}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Takeoff failed: {e}")
@@ -84,7 +120,9 @@ async def px4_takeoff(req: PX4TakeoffRequest, user=Depends(require_roles("DEVELO
 @router.post("/offboard/start")
 async def px4_offboard_start(req: PX4OffboardStartRequest, user=Depends(require_roles("DEVELOPER","ADMIN"))):
     try:
-        await supervisor.px4_offboard_start(req.scenario, send_hz=req.send_hz)
+        async with _PX4_LOCK:
+            await supervisor.px4_offboard_start(req.scenario, send_hz=req.send_hz)
+        _invalidate_status_cache()
         return {"ok": True, "scenario": req.scenario}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Offboard start failed: {e}")
@@ -93,7 +131,9 @@ async def px4_offboard_start(req: PX4OffboardStartRequest, user=Depends(require_
 @router.post("/offboard/stop")
 async def px4_offboard_stop(user=Depends(require_roles("DEVELOPER","ADMIN"))):
     try:
-        await supervisor.px4_offboard_stop()
+        async with _PX4_LOCK:
+            await supervisor.px4_offboard_stop()
+        _invalidate_status_cache()
         return {"ok": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Offboard stop failed: {e}")
@@ -102,7 +142,9 @@ async def px4_offboard_stop(user=Depends(require_roles("DEVELOPER","ADMIN"))):
 @router.post("/land")
 async def px4_land(user=Depends(require_roles("DEVELOPER","ADMIN"))):
     try:
-        await supervisor.px4_land()
+        async with _PX4_LOCK:
+            await supervisor.px4_land()
+        _invalidate_status_cache()
         return {"ok": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Land failed: {e}")
@@ -126,30 +168,51 @@ async def run_experiment(req: RunExperimentRequest, bg: BackgroundTasks, user=De
         _ws({"type": "status", "status": "RAMPING", "phase": "BOOTSTRAP"})
 
         async def _do():
+            # Phase names accumulate locally and go out in one coalesced
+            # frame at the end instead of a socket write per transition
+            # (the old per-phase frames cost 4-5 fan-outs back-to-back,
+            # and slow clients could stall the ramp between steps)
+            phases = []
             try:
-                # PX4 flight setup (each call should be fast after your controller edits)
+                # PX4 flight setup (each call should be fast after your
+                # controller edits). The whole chain holds the control
+                # lock so a stray manual command can't interleave with
+                # bootstrap.
                 print(f"[Experiment] Starting with scenario: {req.scenario.scenario}")
-                _ws({"type": "status", "status": "RAMPING", "phase": "PX4_CONNECTING"})
-                await supervisor.px4_connect()
-                print("[Experiment] PX4 connected")
-
-                _ws({"type": "status", "status": "RAMPING", "phase": "PX4_TAKEOFF"})
-                await supervisor.px4_takeoff(req.takeoff_alt_m)
-                print(f"[Experiment] Takeoff to {req.takeoff_alt_m}m complete")
-
-                _ws({"type": "status", "status": "RAMPING", "phase": "PX4_OFFBOARD_START"})
-                print(f"[Experiment] Starting offboard mode: {req.scenario.scenario}, hz={req.scenario.send_hz}")
-                await supervisor.px4_offboard_start(req.scenario.scenario, send_hz=req.scenario.send_hz)
+                async with _PX4_LOCK:
+                    phases.append("PX4_CONNECTING")
+                    await supervisor.px4_connect()
+                    print("[Experiment] PX4 connected")
+
+                    phases.append("PX4_TAKEOFF")
+                    await supervisor.px4_takeoff(req.takeoff_alt_m)
+                    print(f"[Experiment] Takeoff to {req.takeoff_alt_m}m complete")
+
+                    phases.append("PX4_OFFBOARD_START")
+                    print(f"[Experiment] Starting offboard mode: {req.scenario.scenario}, hz={req.scenario.send_hz}")
+                    # Offboard start is PX4-side; the experiment stack
+                    # (ELRS relay, air node, etc.) is local subprocess
+                    # bootstrap. They share no resources, so run them
+                    # concurrently - bootstrap wall-clock is max of the
+                    # two, not the sum. TaskGroup cancels the sibling if
+                    # either fails.
+                    async with asyncio.TaskGroup() as tg:
+                        tg.create_task(
+                            supervisor.px4_offboard_start(
+                                req.scenario.scenario, send_hz=req.scenario.send_hz
+                            )
+                        )
+                        start_task = tg.create_task(supervisor.start_all(req.ramp))
+                session_id = start_task.result()
                 print(f"[Experiment] Offboard mode started successfully")
-
-                # Start the full experiment stack (ELRS relay, air node, etc.)
-                session_id = await supervisor.start_all(req.ramp)
+                phases.append("RUNNING")
 
                 s = getattr(supervisor.px4, "status", None)
                 _ws({
                     "type": "status",
                     "status": "RAMPING",
                     "phase": "RUNNING",
+                    "phases": phases,
                     "session_id": session_id,
                     "px4": {
                         "armed": getattr(s, "armed", False),
@@ -172,6 +235,8 @@ async def run_experiment(req: RunExperimentRequest, bg: BackgroundTasks, user=De
                     "level": "ERROR",
                     "src": "BACKEND",
                     "code": "EXPERIMENT_START_FAILED",
+                    # Completed phases tell the UI how far bootstrap got
+                    "phases": phases,
                     "msg": str(e),
                 })
 
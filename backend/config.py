@@ -1,6 +1,7 @@
 # backend/config.py
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
+import shutil
 
 class Settings(BaseSettings):
     """
@@ -14,6 +15,7 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     WEBSOCKET_UPDATE_HZ: float = 10.0  # Fixed typo: was WEBSOCKET_PORT
+    DEBUG: bool = False  # Enables full tracebacks in hot-path error logs
     
     # Process Paths (relative to the root of the project)
     PROJECT_ROOT: Path = Path(__file__).parent.parent
@@ -100,6 +102,16 @@ class Settings(BaseSettings):
         extra="allow"
     )
     
+    def model_post_init(self, __context) -> None:
+        # Pre-split the CORS origins once at startup (normalized, whitespace
+        # stripped) so nothing ever re-splits the raw string per request.
+        self.CORS_ORIGINS_LIST = tuple(
+            origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()
+        )
+        # Resolve the socat binary once at startup (shutil.which walks the
+        # whole PATH and stats each candidate); None means not installed.
+        self.SOCAT_PATH = shutil.which(self.SOCAT_BIN)
+
     def validate_scripts_exist(self):
         """Ensure all required scripts exist"""
         for script_name, script_path in [
@@ -0,0 +1,196 @@
+# backend/geo_kernels.py
+import math
+# Bare-name bindings: one LOAD_GLOBAL instead of LOAD_GLOBAL+LOAD_ATTR
+# per trig call when running the pure-Python fallbacks (numba resolves
+# either form at compile time)
+from math import asin, atan, atan2, cos, degrees, radians, sin, sqrt
+
+# Mean Earth radius in meters, bound once instead of per call
+_EARTH_R = 6371000.0
+
+"""
+Geometry kernels for panel gimbal tracking.
+
+These run once per telemetry broadcast tick, so they are compiled with
+numba when it is installed (20-100x faster on trig-heavy scalar math and
+they stop blocking the event loop thread). Without numba the pure-Python
+versions are used - same results, just slower.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate bearing from point 1 to point 2 in degrees (0-360°)"""
+    lat1_rad = radians(lat1)
+    lat2_rad = radians(lat2)
+    dlon_rad = radians(lon2 - lon1)
+    y = sin(dlon_rad) * cos(lat2_rad)
+    x = cos(lat1_rad) * sin(lat2_rad) - sin(lat1_rad) * cos(lat2_rad) * cos(dlon_rad)
+    bearing_rad = atan2(y, x)
+    return (degrees(bearing_rad) + 360) % 360
+
+
+@njit(cache=True, fastmath=True)
+def calculate_horizontal_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate horizontal distance using Haversine formula (meters)"""
+    lat1_rad, lat2_rad = radians(lat1), radians(lat2)
+    dlat_rad, dlon_rad = radians(lat2 - lat1), radians(lon2 - lon1)
+    # x*x instead of ** 2 (plain multiply, no __pow__ dispatch), and
+    # asin(sqrt(a)) instead of atan2(sqrt(a), sqrt(1-a)) - one fewer
+    # sqrt and a cheaper single-argument transcendental
+    s1 = sin(dlat_rad * 0.5)
+    s2 = sin(dlon_rad * 0.5)
+    a = s1 * s1 + cos(lat1_rad) * cos(lat2_rad) * s2 * s2
+    return 2 * _EARTH_R * asin(sqrt(a))
+
+
+@njit(cache=True, fastmath=True)
+def calculate_bearing_and_distance(lat1: float, lon1: float, lat2: float, lon2: float):
+    """
+    Fused bearing + Haversine distance from point 1 to point 2.
+
+    Both formulas need the same radian conversions and lat sin/cos
+    terms; computing them once here halves the trig work versus calling
+    calculate_bearing and calculate_horizontal_distance back to back.
+    Returns (bearing_deg 0-360, distance_m).
+    """
+    lat2_rad = radians(lat2)
+    return _bearing_and_distance_presin(lat1, lon1, lat2, lon2, sin(lat2_rad), cos(lat2_rad))
+
+
+@njit(cache=True, fastmath=True)
+def _bearing_and_distance_presin(
+    lat1: float, lon1: float, lat2: float, lon2: float,
+    sin_lat2: float, cos_lat2: float,
+):
+    """
+    Fused kernel taking point 2's sin/cos already computed. The panel
+    tracker points at a fixed ground station, so its sin/cos only need
+    recomputing when home moves - two fewer trig calls per tick.
+    """
+    lat1_rad = radians(lat1)
+    dlat_rad = radians(lat2 - lat1)
+    dlon_rad = radians(lon2 - lon1)
+    sin_lat1 = sin(lat1_rad)
+    cos_lat1 = cos(lat1_rad)
+    sin_dlon = sin(dlon_rad)
+    cos_dlon = cos(dlon_rad)
+    y = sin_dlon * cos_lat2
+    x = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos_dlon
+    bearing_deg = (degrees(atan2(y, x)) + 360) % 360
+    sin_half_dlat = sin(dlat_rad * 0.5)
+    sin_half_dlon = sin(dlon_rad * 0.5)
+    a = sin_half_dlat * sin_half_dlat + cos_lat1 * cos_lat2 * sin_half_dlon * sin_half_dlon
+    return bearing_deg, 2 * _EARTH_R * asin(sqrt(a))
+
+
+@njit(cache=True, fastmath=True)
+def calculate_elevation_angle(horizontal_dist_m: float, altitude_diff_m: float) -> float:
+    """Calculate elevation angle"""
+    if horizontal_dist_m < 0.1:
+        return -90.0 if altitude_diff_m > 0 else 0.0
+    # The guard above ensures horizontal_dist_m > 0, so single-argument
+    # atan gives the same quadrant as atan2 at lower cost
+    return degrees(atan(-altitude_diff_m / horizontal_dist_m))
+
+
+@njit(cache=True, fastmath=True)
+def _panel_angles_kernel(
+    drone_lat: float, drone_lon: float, drone_alt_m: float,
+    ground_lat: float, ground_lon: float,
+    ground_sin_lat: float, ground_cos_lat: float,
+    drone_yaw_deg: float, horizontal_dist_m: float,
+):
+    """
+    Scalar kernel for the gimbal solution.
+
+    Returns a flat tuple instead of a dict because numba's nopython mode
+    cannot build Python dicts; calculate_panel_angles() re-wraps it.
+    """
+    target_azimuth, computed_dist_m = _bearing_and_distance_presin(
+        drone_lat, drone_lon, ground_lat, ground_lon,
+        ground_sin_lat, ground_cos_lat,
+    )
+    # Prefer the measured distance when the caller has one; fall back to
+    # the GPS-derived Haversine distance (already computed with the
+    # bearing, so the fallback is free)
+    if horizontal_dist_m < 0.1:
+        horizontal_dist_m = computed_dist_m
+    target_elevation = calculate_elevation_angle(horizontal_dist_m, drone_alt_m)
+    # Branchless wrap to [-180, 180): one modulo instead of the
+    # compare-and-subtract loops
+    gimbal_azimuth_deg = (target_azimuth - drone_yaw_deg + 180.0) % 360.0 - 180.0
+    GIMBAL_EL_MIN, GIMBAL_EL_MAX = -45.0, 45.0
+    actual_elevation_deg = max(GIMBAL_EL_MIN, min(GIMBAL_EL_MAX, target_elevation))
+    gimbal_limited = actual_elevation_deg != target_elevation
+    misalignment_deg = abs(target_elevation - actual_elevation_deg) if gimbal_limited else 0.0
+    efficiency_factor = max(0.0, cos(radians(misalignment_deg)))
+    return (
+        target_azimuth, target_elevation, gimbal_azimuth_deg,
+        actual_elevation_deg, gimbal_limited, misalignment_deg, efficiency_factor,
+    )
+
+
+# (lat, sin, cos) of the last ground position seen; home is effectively
+# constant within a session, so this hits on every tick after the first
+_home_trig = (None, 0.0, 0.0)
+
+
+def calculate_panel_angles(
+    drone_lat: float, drone_lon: float, drone_alt_m: float,
+    ground_lat: float, ground_lon: float,
+    drone_yaw_deg: float, horizontal_dist_m: float,
+    drone_roll_deg: float = 0.0, drone_pitch_deg: float = 0.0
+) -> dict:
+    """Calculate 2-axis gimbal angles for panel pointing"""
+    global _home_trig
+    if _home_trig[0] != ground_lat:
+        ground_rad = radians(ground_lat)
+        _home_trig = (ground_lat, sin(ground_rad), cos(ground_rad))
+    (
+        target_azimuth, target_elevation, gimbal_azimuth_deg,
+        actual_elevation_deg, gimbal_limited, misalignment_deg, efficiency_factor,
+    ) = _panel_angles_kernel(
+        drone_lat, drone_lon, drone_alt_m,
+        ground_lat, ground_lon,
+        _home_trig[1], _home_trig[2],
+        drone_yaw_deg, horizontal_dist_m,
+    )
+    return {
+        "panel_target_azimuth_deg": target_azimuth,
+        "panel_target_elevation_deg": target_elevation,
+        "panel_gimbal_azimuth_deg": gimbal_azimuth_deg,
+        "panel_gimbal_elevation_deg": actual_elevation_deg,
+        "panel_gimbal_limited": bool(gimbal_limited),
+        "panel_relative_azimuth_deg": gimbal_azimuth_deg,
+        "panel_misalignment_deg": misalignment_deg,
+        "panel_efficiency_factor": efficiency_factor,
+    }
+
+
+def warm_kernels():
+    """
+    Trigger JIT compilation at startup so the first real telemetry tick
+    doesn't pay the (multi-second) numba compile cost.
+    """
+    calculate_panel_angles(
+        drone_lat=0.0, drone_lon=0.0, drone_alt_m=10.0,
+        ground_lat=0.001, ground_lon=0.001,
+        drone_yaw_deg=0.0, horizontal_dist_m=100.0,
+    )
+    calculate_horizontal_distance(0.0, 0.0, 0.001, 0.001)
@@ -1,19 +1,20 @@
 # main.py
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 import contextlib
 import asyncio
+import anyio
 from typing import List
 import time
+import logging
+import functools
+import orjson
 from pathlib import Path
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-
 from backend.config import settings
+from backend.geo_kernels import calculate_panel_angles, warm_kernels
 from backend.state import state
 from backend.supervisor import supervisor
 from backend.api_px4 import router as px4_router
@@ -30,36 +31,68 @@ from backend.models import (
     SystemStatus,
 )
 
+log = logging.getLogger(__name__)
+
 # ════════════════════════════════════════════════════════════════
 # SECURITY HEADERS MIDDLEWARE
 # ════════════════════════════════════════════════════════════════
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
+# All headers except HSTS are identical for every response, so build them
+# once here instead of re-assembling the strings per request. Includes the
+# Private Network Access header previously added by a second middleware.
+SECURITY_HEADERS = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("X-XSS-Protection", "1; mode=block"),
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    ("Permissions-Policy", "geolocation=(), microphone=(), camera=()"),
+    ("Content-Security-Policy", (
+        "default-src 'self'; "
+        "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net; "
+        "style-src 'self' 'unsafe-inline'; "
+        "img-src 'self' data: https:; "
+        "font-src 'self' data:; "
+        "connect-src 'self' ws: wss: http://localhost:* http://127.0.0.1:*; "
+        "frame-ancestors 'none';"
+    )),
+    ("Access-Control-Allow-Private-Network", "true"),
+)
+
 
-        if request.url.scheme == "https":
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains; preload"
-            )
+class HeadersASGIMiddleware:
+    """
+    Pure ASGI middleware that splices precomputed headers into the
+    http.response.start message.
 
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = (
-            "geolocation=(), microphone=(), camera=()"
-        )
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data: https:; "
-            "font-src 'self' data:; "
-            "connect-src 'self' ws: wss: http://localhost:* http://127.0.0.1:*; "
-            "frame-ancestors 'none';"
+    Why not BaseHTTPMiddleware?
+    - Each BaseHTTPMiddleware layer adds an anyio task + queue hop per request
+    - Raw ASGI just wraps send(), so header injection is a list.extend()
+    """
+
+    def __init__(self, app, headers_list):
+        self.app = app
+        self._headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers_list]
+        self._hsts = (
+            b"strict-transport-security",
+            b"max-age=31536000; includeSubDomains; preload",
         )
-        return response
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        is_https = scope.get("scheme") == "https"
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = message.setdefault("headers", [])
+                headers.extend(self._headers)
+                if is_https:
+                    headers.append(self._hsts)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 # ════════════════════════════════════════════════════════════════
 # BACKGROUND TASKS
@@ -74,16 +107,19 @@ async def _poll_laser_telemetry():
             decoder = get_laser_decoder()
             telemetry = decoder.get_laser_telemetry()
             print(f"[Laser] Retrieved telemetry: {telemetry}")
-            await state.update_laser_telemetry(telemetry)
+            state.update_laser_telemetry(telemetry)
             print(f"[Laser] Updated state successfully")
             await asyncio.sleep(1.0)  # Poll at 1 Hz
         except asyncio.CancelledError:
             print("[Laser] Telemetry polling task cancelled")
             break
         except Exception as e:
-            print(f"[Laser] Polling error: {e}")
-            import traceback
-            traceback.print_exc()
+            # Full tracebacks only when debugging; stack rendering on the
+            # event loop thread is expensive under repeated failures
+            if settings.DEBUG:
+                log.exception("Laser polling error")
+            else:
+                log.warning("Laser polling error: %s", e)
             await asyncio.sleep(5.0)  # Back off on error
 
 # ════════════════════════════════════════════════════════════════
@@ -104,8 +140,8 @@ async def lifespan(app: FastAPI):
         print("Some features may be unavailable, but laser control will work.")
 
     settings.ensure_data_dir()
-    await state.set_status("DISCONNECTED")
-    await state.add_event(
+    state.set_status("DISCONNECTED")
+    state.add_event(
         "INFO",
         "server",
         "SERVER_START",
@@ -113,8 +149,12 @@ async def lifespan(app: FastAPI):
     )
 
     init_db()
+    warm_kernels()  # compile geo kernels before the first telemetry tick
     laser_task = asyncio.create_task(_poll_laser_telemetry())
+    broadcast_task = asyncio.create_task(_telemetry_broadcast_loop())
+    event_task = asyncio.create_task(_event_broadcast_loop())
     print("Laser telemetry polling started")
+    print("Telemetry broadcast loop started")
     print("Backend ready")
     print("="*70)
 
@@ -122,16 +162,14 @@ async def lifespan(app: FastAPI):
 
     print("\n" + "="*70)
     print("LASER POWER BEAMING BACKEND - SHUTTING DOWN")
-    laser_task.cancel()
-    try:
-        await laser_task
-    except asyncio.CancelledError:
-        pass
+    for task in (laser_task, broadcast_task, event_task):
+        task.cancel()
+    await asyncio.gather(laser_task, broadcast_task, event_task, return_exceptions=True)
 
     if supervisor.is_running():
         await supervisor.stop_all()
 
-    await state.add_event("INFO", "server", "SERVER_STOP", "Backend shutting down")
+    state.add_event("INFO", "server", "SERVER_STOP", "Backend shutting down")
     print("Cleanup complete")
     print("="*70)
 
@@ -142,7 +180,9 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     title="Laser Power Beaming API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Rust-backed JSON encoding for every REST response
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(px4_router)
@@ -150,24 +190,16 @@ app.include_router(laser_router)
 app.include_router(auth_router)
 app.include_router(pairing_router)
 
-app.add_middleware(SecurityHeadersMiddleware)
+app.add_middleware(HeadersASGIMiddleware, headers_list=SECURITY_HEADERS)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS.split(","),
+    allow_origins=settings.CORS_ORIGINS_LIST,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
     expose_headers=["*"],
 )
 
-class PrivateNetworkAccessMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        response.headers["Access-Control-Allow-Private-Network"] = "true"
-        return response
-
-app.add_middleware(PrivateNetworkAccessMiddleware)
-
 # ════════════════════════════════════════════════════════════════
 # REST API ENDPOINTS
 # ════════════════════════════════════════════════════════════════
@@ -177,26 +209,26 @@ async def root():
     return {
         "message": "Laser Power Beaming API",
         "version": "1.0.0",
-        "status": await state.get_telemetry_snapshot()
+        "status": state.get_telemetry_snapshot()
     }
 
 @app.get("/health")
 async def health_check():
     return {
         "status": "healthy",
-        "timestamp": int(time.time() * 1000),
+        "timestamp": time.time_ns() // 1_000_000,
         "system": {
             "connected_websockets": len(active_connections),
-            "running_processes": len([p for p in supervisor.get_process_status().values() if p is not None]),
+            "running_processes": supervisor.running_count,
             "state_status": state.status,
         }
     }
 
 @app.get("/status", response_model=SystemStatus)
 async def get_status():
-    # Use the method-based access for thread safety
-    events = await state.get_recent_events(10)
-    errors = [event["msg"] for event in events if event["level"] == "ERROR"]
+    # Lock-free read: recent_errors is maintained by add_event, so this
+    # endpoint no longer serializes telemetry writers behind a lock
+    errors = list(state.recent_errors)
 
     return SystemStatus(
         server_version="1.0.0",
@@ -217,7 +249,7 @@ async def start_ramp(req: RampStartRequest):
         session_id = await supervisor.start_all(req)
         return {"status": "started", "session_id": session_id}
     except Exception as e:
-        await state.add_event("ERROR", "server", "START_FAILED", f"Failed to start ramp: {e}")
+        state.add_event("ERROR", "server", "START_FAILED", f"Failed to start ramp: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/ramp/stop")
@@ -232,263 +264,316 @@ async def stop_ramp():
         await supervisor.stop_all()
         return {"status": "stopped"}
     except Exception as e:
-        await state.add_event("ERROR", "server", "STOP_FAILED", f"Failed to stop ramp: {e}")
+        state.add_event("ERROR", "server", "STOP_FAILED", f"Failed to stop ramp: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/events")
 async def get_events(count: int = 50):
-    return await state.get_recent_events(count)
+    return state.get_recent_events(count)
 
 # ════════════════════════════════════════════════════════════════
 # WEBSOCKET ENDPOINTS
 # ════════════════════════════════════════════════════════════════
 
-active_connections: list[WebSocket] = []
+# Maps each socket to its bounded outbound queue: O(1) add/remove, and a
+# slow client only backs up its own queue, never the broadcast tick.
+active_connections: dict[WebSocket, asyncio.Queue] = {}
+
+# Latest serialized telemetry frame; sent to new clients on connect so they
+# don't wait up to a full tick for their first snapshot.
+_latest_telemetry_buf: bytes | None = None
 
 async def _broadcast_ws(payload: dict):
+    """
+    Fan an event payload out to all clients in parallel with a per-send
+    timeout, so one stuck socket delays the broadcast by at most 50ms
+    instead of stalling every other client behind it.
+    """
     dead = []
-    for ws in list(active_connections):
+
+    async def _safe_send(ws: WebSocket):
         try:
-            await ws.send_json(payload)
+            with anyio.move_on_after(0.05):
+                await ws.send_json(payload)
         except Exception:
             dead.append(ws)
-    for ws in dead:
-        with contextlib.suppress(Exception):
-            active_connections.remove(ws)
 
-broadcast_func = lambda payload: asyncio.create_task(_broadcast_ws(payload))
-supervisor.ws_broadcast = broadcast_func
-state.ws_broadcast = broadcast_func
+    async with anyio.create_task_group() as tg:
+        for ws in tuple(active_connections):
+            tg.start_soon(_safe_send, ws)
 
-@app.websocket("/ws/telemetry")
-async def websocket_telemetry(websocket: WebSocket):
-    token = websocket.query_params.get("token")
-    if settings.ENABLE_AUTH:
-        if token:
-            payload = decode_token(token or "")
-            roles = set((payload or {}).get("roles", []))
-            if not payload or not roles.intersection({"VIEWER", "DEVELOPER", "ADMIN"}):
-                await websocket.close(code=4403)
-                return
+    for ws in dead:
+        active_connections.pop(ws, None)
 
-    await websocket.accept()
-    active_connections.append(websocket)
-    await state.add_event(
-        "INFO",
-        "server",
-        "WS_CONNECT",
-        f"Client connected (total: {len(active_connections)})"
-    )
+async def _ws_writer(websocket: WebSocket, queue: asyncio.Queue):
+    """
+    Drain one connection's outbound queue.
 
-    period = 1.0 / settings.WEBSOCKET_UPDATE_HZ
+    Telemetry is lossy - newest wins - so the queue is tiny (maxsize=2)
+    and the broadcaster drops the oldest frame when it's full rather
+    than waiting on a slow client.
+    """
+    try:
+        while True:
+            buf = await queue.get()
+            await websocket.send_bytes(buf)
+    except Exception:
+        # Client went away mid-send; the handler's receive loop notices
+        # the disconnect and cleans up. Returning here keeps the task
+        # from finishing with an unretrieved exception ("Task exception
+        # was never retrieved" spam under disconnect churn - cancelling
+        # an already-done task is a no-op).
+        return
+
+def _queue_latest(queue: asyncio.Queue, buf: bytes):
+    """put_nowait with drop-oldest semantics on a full queue"""
+    try:
+        queue.put_nowait(buf)
+    except asyncio.QueueFull:
+        with contextlib.suppress(asyncio.QueueEmpty):
+            queue.get_nowait()
+        with contextlib.suppress(asyncio.QueueFull):
+            queue.put_nowait(buf)
+
+# Event/status broadcasts are coalesced through one long-lived task instead
+# of spawning a fresh asyncio.Task per event: high-frequency parser updates
+# would otherwise allocate thousands of short-lived coroutine frames.
+# Newest-wins - if events arrive faster than the fan-out, only the latest
+# payload is sent.
+_bcast_latest: dict | None = None
+_bcast_event = asyncio.Event()
+
+def _set_broadcast(payload: dict):
+    global _bcast_latest
+    _bcast_latest = payload
+    _bcast_event.set()
+
+# Kept in sync with active_connections by the WS handler; lets event
+# producers (state's batch broadcaster) skip payload construction
+# entirely while nobody is connected.
+_set_broadcast.listener_count = 0
+
+async def _event_broadcast_loop():
+    while True:
+        await _bcast_event.wait()
+        _bcast_event.clear()
+        payload = _bcast_latest
+        if payload is not None:
+            await _broadcast_ws(payload)
 
+broadcast_func = _set_broadcast
+supervisor.ws_broadcast = broadcast_func
+state.ws_broadcast = broadcast_func
 
-    # Send initial telemetry immediately on connect
-    print("[WS] Sending initial telemetry snapshot")
-    initial_telemetry = await state.get_telemetry_snapshot()
-    await websocket.send_json({"type": "telemetry", "status": state.status, **initial_telemetry})
-    
+def _build_telemetry_payload(telemetry: dict, rtt_p95: float, rtt_p99: float) -> bytes:
+    """
+    Pure-CPU half of a broadcast tick: panel trig + message assembly +
+    orjson serialization. Runs in the default thread pool so it never
+    blocks the event loop (which also serves HTTP and event broadcasts).
+    """
+    # Bind the bound-method once; ~35 lookups per tick go through it
+    g = telemetry.get
+
+    panel_data = {}
+    if (g("gps_lat_1e7") is not None and g("home_lat_1e7") is not None):
+        try:
+            # A measured distance below 0.1 m makes the kernel fall back
+            # to its GPS-derived Haversine distance internally. GPS is
+            # stored in int µdeg/mm; scale to degrees/meters here.
+            panel_data = calculate_panel_angles(
+                drone_lat=telemetry["gps_lat_1e7"] * 1e-7,
+                drone_lon=telemetry["gps_lon_1e7"] * 1e-7,
+                drone_alt_m=(g("gps_rel_alt_mm") or 0) * 1e-3,
+                ground_lat=telemetry["home_lat_1e7"] * 1e-7,
+                ground_lon=telemetry["home_lon_1e7"] * 1e-7,
+                drone_yaw_deg=g("yaw_deg", 0.0),
+                horizontal_dist_m=g("distance_m", 0.0),
+                drone_roll_deg=g("roll_deg", 0.0),
+                drone_pitch_deg=g("pitch_deg", 0.0),
+            )
+        except Exception as e:
+            # Keep this lightweight; don't spam tracebacks every tick.
+            log.warning("Panel angle calc error: %s", e)
 
-    # Send initial telemetry immediately on connect
-    print("[WS] Sending initial telemetry snapshot")
-    telemetry = await state.get_telemetry_snapshot()
-    initial_payload = {
-        "type": "telemetry",
-        "power": {
-            "commanded_w": telemetry.get("commanded_w", 0.0),
-            "received_mw": telemetry.get("received_mw", 0.0),
-            "efficiency_pct": telemetry.get("efficiency_pct", 0.0),
-        },
-        "status": state.status,
-        "session_id": state.session_id or "",
-    }
-    await websocket.send_json(initial_payload)
-    
-
-    # Send initial telemetry immediately on connect
-    print("[WS] Sending initial telemetry snapshot")
-    telemetry = await state.get_telemetry_snapshot()
-    rtt_p95, rtt_p99 = await state.calculate_rtt_percentiles()
-    
-    initial_payload = {
+    # One clock read per tick, shared by both timestamp fields
+    now_ms = time.time_ns() // 1_000_000
+
+    message = {
         "type": "telemetry",
-        "ts": int(time.time() * 1000),
+        "ts": now_ms,
         "power": {
-            "commanded_w": telemetry.get("commanded_w", 0.0),
-            "received_mw": telemetry.get("received_mw", 0.0),
-            "efficiency_pct": telemetry.get("efficiency_pct", 0.0),
+            "commanded_w": g("commanded_w", 0.0),
+            "received_mw": g("received_mw", 0.0),
+            "efficiency_pct": g("efficiency_pct", 0.0),
         },
         "link": {
-            "quality_pct": telemetry.get("link_quality_pct", 0),
-            "rtt_ms": telemetry.get("rtt_ms", 0.0),
+            "quality_pct": g("link_quality_pct", 0),
+            "rtt_ms": g("rtt_ms", 0.0),
             "rtt_p95_ms": rtt_p95,
             "rtt_p99_ms": rtt_p99,
         },
         "permit": {
-            "granted": telemetry.get("granted", False),
-            "deny_reason": telemetry.get("deny_reason"),
-            "grants_total": telemetry.get("grants_total", 0),
-            "denies_total": telemetry.get("denies_total", 0),
-            "seq": telemetry.get("seq", 0),
+            "granted": g("granted", False),
+            "deny_reason": g("deny_reason"),
+            "grants_total": g("grants_total", 0),
+            "denies_total": g("denies_total", 0),
+            "seq": g("seq", 0),
             "bypass_enabled": settings.BYPASS_PHOTON_HANDSHAKE,
         },
         "battery": {
-            "voltage_mv": telemetry.get("voltage_mv") or telemetry.get("px4_voltage_mv", 0),
-            "current_ma": telemetry.get("current_ma") or telemetry.get("px4_current_ma", 0),
-            "soc_pct": telemetry.get("soc_pct", 0.0),
-            "temp_cdeg": telemetry.get("temp_cdeg", 0),
+            "voltage_mv": g("voltage_mv") or g("px4_voltage_mv", 0),
+            "current_ma": g("current_ma") or g("px4_current_ma", 0),
+            "soc_pct": g("soc_pct", 0.0),
+            "temp_cdeg": g("temp_cdeg", 0),
         },
-        "gps": None,
+        # MAVLink wire units (int µdeg / mm): ~half the serialized bytes
+        # of the equivalent doubles
+        "gps": {
+            "lat_1e7": g("gps_lat_1e7"),
+            "lon_1e7": g("gps_lon_1e7"),
+            "alt_mm": g("gps_alt_mm"),
+            "rel_alt_mm": g("gps_rel_alt_mm"),
+        } if g("gps_lat_1e7") is not None else None,
         "attitude": {
-            "distance_m": telemetry.get("distance_m", 0.0),
-            "roll_deg": telemetry.get("roll_deg", 0.0),
-            "pitch_deg": telemetry.get("pitch_deg", 0.0),
-            "yaw_deg": telemetry.get("yaw_deg", 0.0),
-            "cone_violation": telemetry.get("cone_violation", False),
+            "distance_m": g("distance_m", 0.0),
+            "roll_deg": g("roll_deg", 0.0),
+            "pitch_deg": g("pitch_deg", 0.0),
+            "yaw_deg": g("yaw_deg", 0.0),
+            "cone_violation": g("cone_violation", False),
         },
-        "panel": None,
+        "panel": panel_data if panel_data else None,
         "ramp": {
-            "current_pct": telemetry.get("commanded_pct", 0),
-            "level_str": telemetry.get("ramp_level_str", "0/0"),
+            "current_pct": g("commanded_pct", 0),
+            "level_str": g("ramp_level_str", "0/0"),
         },
         "laser": {
-            "connected": telemetry.get("laser_connected", False),
-            "avg_power_w": telemetry.get("laser_avg_power_w", 0.0),
-            "status_flags": telemetry.get("laser_status_flags", {}),
+            "connected": g("laser_connected", False),
+            "avg_power_w": g("laser_avg_power_w", 0.0),
+            "peak_power_w": g("laser_peak_power_w", 0.0),
+            "commanded_w": g("laser_commanded_w", 0.0),
+            "case_temperature_c": g("laser_case_temperature_c", 0.0),
+            "board_temperature_c": g("laser_board_temperature_c", 0.0),
+            "setpoint_pct": g("laser_setpoint_pct", 0.0),
+            "status_flags": g("laser_status_flags", {}),
+            "status_word": g("laser_status_word", 0),
+            "device_id": g("laser_device_id", "Unknown"),
+            "firmware_revision": g("laser_firmware_revision", "Unknown"),
+            "error": g("laser_error"),
+
+            # Legacy aliases for backward compatibility
+            "output_power_w": g("laser_avg_power_w", 0.0),
+            "temperature_c": g("laser_case_temperature_c", 0.0),
+            "emission_on": g("laser_status_flags", {}).get("emission_on", False),
+            "power_supply_on": g("laser_status_flags", {}).get("power_supply_on", False),
+            "alarm_critical": g("laser_status_flags", {}).get("alarm_critical", False),
+            "alarm_overheat": g("laser_status_flags", {}).get("alarm_overheat", False),
         },
-        "status": state.status,
-        "session_id": state.session_id or "",
-        "scenario": state.scenario,
-        "server_ts_ms": int(time.time() * 1000)
+        "status": g("status", "DISCONNECTED"),
+        "session_id": g("session_id") or "",
+        "scenario": g("scenario", "Unknown"),
+        "server_ts_ms": now_ms
     }
-    await websocket.send_json(initial_payload)
-    
-    try:
-        while True:
-            print(f"[WS] Loop start - connections: {len(active_connections)}, auth: {settings.ENABLE_AUTH}")
-            telemetry = await state.get_telemetry_snapshot()
-            print("[WS] Got telemetry snapshot")
-            rtt_p95, rtt_p99 = await state.calculate_rtt_percentiles()
-            print(f"[WS] Got RTT percentiles: p95={rtt_p95}, p99={rtt_p99}")
-
-            # Panel calculation
-            print("[WS] Starting panel calculation")
-            from backend.state import calculate_panel_angles, calculate_horizontal_distance
-            panel_data = {}
-            print("[WS] Panel data initialized")
-            if (telemetry.get("gps_lat_deg") is not None and telemetry.get("home_lat_deg") is not None):
-                print("[WS] GPS data present, calculating panel angles")
-                try:
-                    h_dist = telemetry.get("distance_m", 0.0)
-                    if h_dist < 0.1:
-                        print("[WS] Calling calculate_horizontal_distance")
-                        h_dist = calculate_horizontal_distance(
-                            telemetry["gps_lat_deg"], telemetry["gps_lon_deg"],
-                            telemetry["home_lat_deg"], telemetry["home_lon_deg"]
-                        )
-                    print("[WS] Calling calculate_panel_angles")
-                    panel_data = calculate_panel_angles(
-                        drone_lat=telemetry["gps_lat_deg"],
-                        drone_lon=telemetry["gps_lon_deg"],
-                        drone_alt_m=telemetry.get("gps_rel_alt_m", 0.0),
-                        ground_lat=telemetry["home_lat_deg"],
-                        ground_lon=telemetry["home_lon_deg"],
-                        drone_yaw_deg=telemetry.get("yaw_deg", 0.0),
-                        horizontal_dist_m=h_dist,
-                        drone_roll_deg=telemetry.get("roll_deg", 0.0),
-                        drone_pitch_deg=telemetry.get("pitch_deg", 0.0),
-                    )
-                except Exception as e:
-                    # Keep this lightweight; don't spam tracebacks every tick.
-                    print(f"[Panel] Angle calc error: {e}")
-
-            print("[WS] Building message dict")
-            message = {
-                "type": "telemetry",
-                "ts": int(time.time() * 1000),
-                "power": {
-                    "commanded_w": telemetry.get("commanded_w", 0.0),
-                    "received_mw": telemetry.get("received_mw", 0.0),
-                    "efficiency_pct": telemetry.get("efficiency_pct", 0.0),
-                },
-                "link": {
-                    "quality_pct": telemetry.get("link_quality_pct", 0),
-                    "rtt_ms": telemetry.get("rtt_ms", 0.0),
-                    "rtt_p95_ms": rtt_p95,
-                    "rtt_p99_ms": rtt_p99,
-                },
-                "permit": {
-                    "granted": telemetry.get("granted", False),
-                    "deny_reason": telemetry.get("deny_reason"),
-                    "grants_total": telemetry.get("grants_total", 0),
-                    "denies_total": telemetry.get("denies_total", 0),
-                    "seq": telemetry.get("seq", 0),
-                    "bypass_enabled": settings.BYPASS_PHOTON_HANDSHAKE,
-                },
-                "battery": {
-                    "voltage_mv": telemetry.get("voltage_mv") or telemetry.get("px4_voltage_mv", 0),
-                    "current_ma": telemetry.get("current_ma") or telemetry.get("px4_current_ma", 0),
-                    "soc_pct": telemetry.get("soc_pct", 0.0),
-                    "temp_cdeg": telemetry.get("temp_cdeg", 0),
-                },
-                "gps": {
-                    "lat_deg": telemetry.get("gps_lat_deg"),
-                    "lon_deg": telemetry.get("gps_lon_deg"),
-                    "alt_m": telemetry.get("gps_alt_m"),
-                    "rel_alt_m": telemetry.get("gps_rel_alt_m"),
-                } if telemetry.get("gps_lat_deg") is not None else None,
-                "attitude": {
-                    "distance_m": telemetry.get("distance_m", 0.0),
-                    "roll_deg": telemetry.get("roll_deg", 0.0),
-                    "pitch_deg": telemetry.get("pitch_deg", 0.0),
-                    "yaw_deg": telemetry.get("yaw_deg", 0.0),
-                    "cone_violation": telemetry.get("cone_violation", False),
-                },
-                "panel": panel_data if panel_data else None,
-                "ramp": {
-                    "current_pct": telemetry.get("commanded_pct", 0),
-                    "level_str": telemetry.get("ramp_level_str", "0/0"),
-                },
-                "laser": {
-                    "connected": telemetry.get("laser_connected", False),
-                    "avg_power_w": telemetry.get("laser_avg_power_w", 0.0),
-                    "peak_power_w": telemetry.get("laser_peak_power_w", 0.0),
-                    "commanded_w": telemetry.get("laser_commanded_w", 0.0),
-                    "case_temperature_c": telemetry.get("laser_case_temperature_c", 0.0),
-                    "board_temperature_c": telemetry.get("laser_board_temperature_c", 0.0),
-                    "setpoint_pct": telemetry.get("laser_setpoint_pct", 0.0),
-                    "status_flags": telemetry.get("laser_status_flags", {}),
-                    "status_word": telemetry.get("laser_status_word", 0),
-                    "device_id": telemetry.get("laser_device_id", "Unknown"),
-                    "firmware_revision": telemetry.get("laser_firmware_revision", "Unknown"),
-                    "error": telemetry.get("laser_error"),
-
-                    # Legacy aliases for backward compatibility
-                    "output_power_w": telemetry.get("laser_avg_power_w", 0.0),
-                    "temperature_c": telemetry.get("laser_case_temperature_c", 0.0),
-                    "emission_on": telemetry.get("laser_status_flags", {}).get("emission_on", False),
-                    "power_supply_on": telemetry.get("laser_status_flags", {}).get("power_supply_on", False),
-                    "alarm_critical": telemetry.get("laser_status_flags", {}).get("alarm_critical", False),
-                    "alarm_overheat": telemetry.get("laser_status_flags", {}).get("alarm_overheat", False),
-                },
-                "status": state.status,
-                "session_id": state.session_id or "",
-                "scenario": state.scenario,
-                "server_ts_ms": int(time.time() * 1000)
-            }
-
-            print(f"[WS] Sending laser data: connected={message['laser']['connected']}, power={message['laser']['avg_power_w']}W")
-
-            print(f"[WS] Message built, size: {len(str(message))} chars")
-            await websocket.send_json(message)
-            print("[WS] Message sent successfully")
+
+    # Serialize once, fan the same bytes out to every client
+    return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY)
+
+async def _telemetry_broadcast_loop():
+    """
+    Build + serialize the telemetry frame once per tick and fan the same
+    bytes out to every connected client.
+
+    Why centralized?
+    - With K clients, snapshot + panel math + JSON used to run K times per
+      tick (once inside each connection handler)
+    - Here it runs once; per-client cost is just the socket send
+    """
+    global _latest_telemetry_buf
+    period = 1.0 / settings.WEBSOCKET_UPDATE_HZ
+    loop = asyncio.get_running_loop()
+
+    while True:
+        try:
+            telemetry = state.get_telemetry_snapshot()
+            rtt_p95, rtt_p99 = state.calculate_rtt_percentiles()
+
+            # Serialize once (off-loop), fan the same bytes out to every client
+            buf = await loop.run_in_executor(
+                None, _build_telemetry_payload, telemetry, rtt_p95, rtt_p99
+            )
+            _latest_telemetry_buf = buf
+
+            # Hand the frame to each connection's writer; never awaits a
+            # socket here, so one stuck client can't stall the tick.
+            for queue in tuple(active_connections.values()):
+                _queue_latest(queue, buf)
+
             await asyncio.sleep(period)
 
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            if settings.DEBUG:
+                log.exception("WS broadcast loop error")
+            else:
+                log.warning("WS broadcast loop error: %s", e)
+            await asyncio.sleep(1.0)
+
+@functools.lru_cache(maxsize=256)
+def _decode_token_cached(token: str):
+    """
+    Cache JWT validations across WS reconnects - signature verification is
+    tens of microseconds and reconnect storms hit it repeatedly with the
+    same token. Expiry is re-checked on every hit so a cached payload can
+    never outlive its token.
+    """
+    return decode_token(token)
+
+def _ws_auth_payload(token: str):
+    payload = _decode_token_cached(token)
+    if payload and payload.get("exp", 0) < time.time():
+        return None
+    return payload
+
+@app.websocket("/ws/telemetry")
+async def websocket_telemetry(websocket: WebSocket):
+    token = websocket.query_params.get("token")
+    if settings.ENABLE_AUTH:
+        if token:
+            payload = _ws_auth_payload(token)
+            roles = set((payload or {}).get("roles", []))
+            if not payload or not roles.intersection({"VIEWER", "DEVELOPER", "ADMIN"}):
+                await websocket.close(code=4403)
+                return
+
+    await websocket.accept()
+    send_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+    writer_task = asyncio.create_task(_ws_writer(websocket, send_queue))
+    active_connections[websocket] = send_queue
+    _set_broadcast.listener_count = len(active_connections)
+    state.add_event(
+        "INFO",
+        "server",
+        "WS_CONNECT",
+        f"Client connected (total: {len(active_connections)})"
+    )
+
+    # Send the latest frame immediately on connect; the broadcast loop
+    # handles all subsequent ticks.
+    if _latest_telemetry_buf is not None:
+        _queue_latest(send_queue, _latest_telemetry_buf)
+
+    try:
+        # The connection handler only needs to notice disconnects; any
+        # inbound frames from the client are ignored.
+        while True:
+            await websocket.receive_text()
     except (WebSocketDisconnect, Exception):
-        if websocket in active_connections:
-            active_connections.remove(websocket)
+        pass
     finally:
-        await state.add_event(
+        writer_task.cancel()
+        active_connections.pop(websocket, None)
+        _set_broadcast.listener_count = len(active_connections)
+        state.add_event(
             "INFO",
             "server",
             "WS_DISCONNECT",
@@ -503,18 +588,27 @@ if __name__ == "__main__":
     import uvicorn
     from backend.ssl_manager import ssl_manager
 
+    # uvloop (C event loop) + httptools (C HTTP parser): both directly
+    # speed up the WS fan-out and REST endpoints under load.
+    uvicorn_opts = dict(
+        host=settings.HOST,
+        port=settings.PORT,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+    )
+
     if settings.ENABLE_HTTPS:
         try:
             cert_file, key_file = ssl_manager.ensure_certificates()
             uvicorn.run(
                 app,
-                host=settings.HOST,
-                port=settings.PORT,
                 ssl_keyfile=str(key_file),
                 ssl_certfile=str(cert_file),
+                **uvicorn_opts,
             )
         except Exception:
-            uvicorn.run(app, host=settings.HOST, port=settings.PORT)
+            uvicorn.run(app, **uvicorn_opts)
     else:
-        uvicorn.run(app, host=settings.HOST, port=settings.PORT)
+        uvicorn.run(app, **uvicorn_opts)
 
@@ -1,10 +1,17 @@
 # backend/models.py
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Dict, List, Literal, Optional
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
+# Single source of truth for flight scenario names; keep in sync with the
+# PX4OffboardStartRequest.scenario Literal below. frozenset gives O(1)
+# membership for the validator that runs on every /ramp/start.
+VALID_SCENARIOS = frozenset({"Hover", "Hold", "Circle", "Square", "Figure8"})
+
+
 # ==============================================================================
 # REQUEST MODELS (UI -> Server)
 # ==============================================================================
@@ -30,17 +37,28 @@ class RampStartRequest(BaseModel):
     @field_validator("scenario")
     @classmethod
     def validate_scenario(cls, v: str) -> str:
-        valid = [
-            "Hover",
-            "Hold",
-            "Circle",
-            "Square",
-            "Figure8",
-        ]
-        if v not in valid:
-            raise ValueError(f"scenario must be one of {valid}")
+        if v not in VALID_SCENARIOS:
+            raise ValueError(f"scenario must be one of {sorted(VALID_SCENARIOS)}")
         return v
 
+    @cached_property
+    def env_dict(self) -> Dict[str, str]:
+        """
+        Ramp parameters pre-stringified as subprocess env vars.
+
+        Computed once per validated request, so restart/retry paths
+        reuse the same mapping, and the params-to-env contract lives
+        with the model instead of the supervisor.
+        """
+        return {
+            "MIN_POWER_PCT": str(self.min_power_pct),
+            "MAX_POWER_PCT": str(self.max_power_pct),
+            "STEP_PCT": str(self.step_pct),
+            "DWELL_TIME_S": str(self.dwell_time_s),
+            "MAX_POWER_W": str(self.max_power_w),
+            "SCENARIO_NAME": self.scenario,
+        }
+
 
 # Backwards-compat alias if any code still refers to RampRequest
 RampRequest = RampStartRequest
@@ -4,6 +4,7 @@ Provides secure pairing for local devices to connect to the ground station
 """
 import secrets
 import random
+import threading
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 from pydantic import BaseModel
@@ -35,6 +36,12 @@ class PairingManager:
         self.pairing_code: Optional[int] = None
         self.pairing_expires_at: Optional[datetime] = None
         self.paired_devices: Dict[str, PairedDevice] = {}
+
+        # The API layer runs verify/pair through the thread pool, so
+        # calls can genuinely overlap; this serializes every
+        # read-modify-write of paired_devices and the JSON files.
+        # RLock because pair_device/get_status call is_pairing_active.
+        self._lock = threading.RLock()
         
         # Ensure directory exists
         self.storage_file.parent.mkdir(parents=True, exist_ok=True)
@@ -108,43 +115,46 @@ class PairingManager:
         Start pairing mode and generate a 6-digit pairing code.
         Returns the pairing code that should be displayed to the user.
         """
-        self.pairing_code = random.randint(100000, 999999)
-        self.pairing_expires_at = datetime.now() + timedelta(seconds=timeout_seconds)
-
-        logger.info(f"═══════════════════════════════════════")
-        logger.info(f"  PAIRING MODE ACTIVE")
-        logger.info(f"  ")
-        logger.info(f"  Code: {self.pairing_code}")
-        logger.info(f"  ")
-        logger.info(f"  Valid for: {timeout_seconds // 60} minutes")
-        logger.info(f"═══════════════════════════════════════")
+        with self._lock:
+            self.pairing_code = random.randint(100000, 999999)
+            self.pairing_expires_at = datetime.now() + timedelta(seconds=timeout_seconds)
+
+            logger.info(f"═══════════════════════════════════════")
+            logger.info(f"  PAIRING MODE ACTIVE")
+            logger.info(f"  ")
+            logger.info(f"  Code: {self.pairing_code}")
+            logger.info(f"  ")
+            logger.info(f"  Valid for: {timeout_seconds // 60} minutes")
+            logger.info(f"═══════════════════════════════════════")
 
-        self._save_pairing_state()
-        return self.pairing_code
+            self._save_pairing_state()
+            return self.pairing_code
 
     def cancel_pairing_mode(self):
         """Cancel pairing mode"""
-        self.pairing_code = None
-        self.pairing_expires_at = None
-        self._save_pairing_state()
+        with self._lock:
+            self.pairing_code = None
+            self.pairing_expires_at = None
+            self._save_pairing_state()
         logger.info("Pairing mode cancelled")
 
     def is_pairing_active(self) -> bool:
         """Check if pairing mode is currently active"""
-        # Always refresh state from disk to catch CLI updates
-        self._load_pairing_state()
+        with self._lock:
+            # Always refresh state from disk to catch CLI updates
+            self._load_pairing_state()
 
-        if not self.pairing_code or not self.pairing_expires_at:
-            return False
-            
-        if datetime.now() > self.pairing_expires_at:
-            # Expired
-            self.pairing_code = None
-            self.pairing_expires_at = None
-            self._save_pairing_state()
-            return False
+            if not self.pairing_code or not self.pairing_expires_at:
+                return False
 
-        return True
+            if datetime.now() > self.pairing_expires_at:
+                # Expired
+                self.pairing_code = None
+                self.pairing_expires_at = None
+                self._save_pairing_state()
+                return False
+
+            return True
 
     def pair_device(
         self, 
@@ -157,42 +167,43 @@ class PairingManager:
         Pair a device using the pairing code.
         Returns authentication token if successful, None otherwise.
         """
-        # Refresh state
-        self._load_pairing_state()
+        with self._lock:
+            # Refresh state
+            self._load_pairing_state()
 
-        # Check if pairing is active
-        if not self.is_pairing_active():
-            logger.warning("Pairing attempt with no active pairing mode")
-            return None
+            # Check if pairing is active
+            if not self.is_pairing_active():
+                logger.warning("Pairing attempt with no active pairing mode")
+                return None
 
-        # Verify code
-        try:
-            if int(code) != self.pairing_code:
-                logger.warning(f"Invalid pairing code attempt: {code}")
+            # Verify code
+            try:
+                if int(code) != self.pairing_code:
+                    logger.warning(f"Invalid pairing code attempt: {code}")
+                    return None
+            except (ValueError, TypeError):
                 return None
-        except (ValueError, TypeError):
-            return None
-
-        # Generate secure token
-        token = secrets.token_urlsafe(32)
-
-        # Create paired device
-        device = PairedDevice(
-            token=token,
-            device_name=device_name,
-            device_type=device_type,
-            paired_at=datetime.now(),
-            last_seen=datetime.now(),
-            access_level=access_level
-        )
-
-        self.paired_devices[token] = device
-        self._save_paired_devices()
-
-        # Clear pairing mode
-        self.pairing_code = None
-        self.pairing_expires_at = None
-        self._save_pairing_state()
+
+            # Generate secure token
+            token = secrets.token_urlsafe(32)
+
+            # Create paired device
+            device = PairedDevice(
+                token=token,
+                device_name=device_name,
+                device_type=device_type,
+                paired_at=datetime.now(),
+                last_seen=datetime.now(),
+                access_level=access_level
+            )
+
+            self.paired_devices[token] = device
+            self._save_paired_devices()
+
+            # Clear pairing mode
+            self.pairing_code = None
+            self.pairing_expires_at = None
+            self._save_pairing_state()
 
         logger.info(f"✓ Device paired successfully: {device_name} ({device_type})")
         return token
@@ -202,43 +213,51 @@ class PairingManager:
         Verify an authentication token.
         Returns PairedDevice if valid, None otherwise.
         """
-        if token not in self.paired_devices:
-            return None
+        with self._lock:
+            if token not in self.paired_devices:
+                return None
 
-        device = self.paired_devices[token]
-        # Update last seen
-        device.last_seen = datetime.now()
-        self._save_paired_devices()
+            device = self.paired_devices[token]
+            # Update last seen
+            device.last_seen = datetime.now()
+            self._save_paired_devices()
 
-        return device
+            return device
 
     def unpair_device(self, token: str) -> bool:
         """Unpair a device"""
-        if token in self.paired_devices:
-            device = self.paired_devices.pop(token)
-            self._save_paired_devices()
-            logger.info(f"Device unpaired: {device.device_name}")
-            return True
-        return False
+        with self._lock:
+            if token in self.paired_devices:
+                device = self.paired_devices.pop(token)
+                self._save_paired_devices()
+                logger.info(f"Device unpaired: {device.device_name}")
+                return True
+            return False
 
     def get_paired_devices(self) -> List[PairedDevice]:
         """Get list of all paired devices"""
-        return list(self.paired_devices.values())
+        with self._lock:
+            return list(self.paired_devices.values())
 
     def unpair_all(self):
         """Unpair all devices (factory reset)"""
-        count = len(self.paired_devices)
-        self.paired_devices.clear()
-        self._save_paired_devices()
+        with self._lock:
+            count = len(self.paired_devices)
+            self.paired_devices.clear()
+            self._save_paired_devices()
         logger.info(f"All devices unpaired (removed {count} devices)")
 
     def get_status(self) -> dict:
         """Get pairing system status"""
+        with self._lock:
+            return self._get_status_locked()
+
+    def _get_status_locked(self) -> dict:
         # Refresh state for accurate reporting
         self._load_pairing_state()
-        
+
         active = self.is_pairing_active()
-        
+
         return {
             "pairing_active": active,
             "pairing_expires_at": self.pairing_expires_at.isoformat() if active else None,
@@ -156,22 +156,24 @@ class PX4Controller:
                 """Collect GPS coordinates and altitude"""
                 count = 0
                 async for pos in self._drone.telemetry.position():
+                    # Quantize to MAVLink wire units (int µdeg / mm) once
+                    # at ingestion; everything downstream stays integer
                     gps_data = {
-                        "gps_lat_deg": float(pos.latitude_deg),
-                        "gps_lon_deg": float(pos.longitude_deg),
-                        "gps_alt_m": float(pos.absolute_altitude_m),
-                        "gps_rel_alt_m": float(pos.relative_altitude_m),
+                        "gps_lat_1e7": int(pos.latitude_deg * 1e7),
+                        "gps_lon_1e7": int(pos.longitude_deg * 1e7),
+                        "gps_alt_mm": int(pos.absolute_altitude_m * 1000),
+                        "gps_rel_alt_mm": int(pos.relative_altitude_m * 1000),
                     }
                     # Log every 20th GPS update (once per 2 seconds at 10Hz)
                     if count % 20 == 0:
-                        print(f"[PX4] GPS: lat={gps_data['gps_lat_deg']:.7f}, lon={gps_data['gps_lon_deg']:.7f}, alt={gps_data['gps_rel_alt_m']:.1f}m")
+                        print(f"[PX4] GPS: lat={gps_data['gps_lat_1e7'] * 1e-7:.7f}, lon={gps_data['gps_lon_1e7'] * 1e-7:.7f}, alt={gps_data['gps_rel_alt_mm'] / 1000:.1f}m")
                     count += 1
-                    await state.update_telemetry(gps_data)
+                    state.update_telemetry(gps_data)
 
             async def pump_attitude():
                 """Collect roll, pitch, yaw"""
                 async for att in self._drone.telemetry.attitude_euler():
-                    await state.update_telemetry({
+                    state.update_telemetry({
                         "roll_deg": float(att.roll_deg),
                         "pitch_deg": float(att.pitch_deg),
                         "yaw_deg": float(att.yaw_deg),
@@ -180,7 +182,7 @@ class PX4Controller:
             async def pump_battery():
                 """Collect PX4 battery data"""
                 async for bat in self._drone.telemetry.battery():
-                    await state.update_telemetry({
+                    state.update_telemetry({
                         "px4_voltage_mv": int(bat.voltage_v * 1000),
                         "px4_current_ma": int(bat.current_battery_a * 1000),
                     })
@@ -1,20 +1,66 @@
 import asyncio
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Deque
+from types import MappingProxyType
+from typing import Mapping, Optional, Dict, List, Deque
 from collections import deque
 import time
 import numpy as np
 
-@dataclass
+# Template for a fresh telemetry dict. Built once; __init__ and
+# start_session take a C-level .copy() instead of re-hashing every key
+# through a 40-key dict literal.
+_TELEMETRY_DEFAULTS = {
+    "commanded_pct": 0, "commanded_w": 0.0, "received_mw": 0.0, "efficiency_pct": 0.0,
+    "link_quality_pct": 0, "rtt_ms": 0.0, "granted": False, "deny_reason": None,
+    "grants_total": 0, "denies_total": 0, "seq": 0, "voltage_mv": 0, "current_ma": 0,
+    "soc_pct": 0.0, "temp_cdeg": 0, "distance_m": 0.0, "roll_deg": 0.0, "pitch_deg": 0.0,
+    # GPS stored as MAVLink wire units: int micro-degrees (x1e7) and
+    # millimeters - small ints serialize/compare cheaper than doubles
+    "yaw_deg": 0.0, "gps_lat_1e7": None, "gps_lon_1e7": None, "gps_alt_mm": None,
+    "gps_rel_alt_mm": None, "home_lat_1e7": None, "home_lon_1e7": None,
+    "panel_target_azimuth_deg": 0.0, "panel_target_elevation_deg": 0.0,
+    "panel_gimbal_azimuth_deg": 0.0, "panel_gimbal_elevation_deg": 0.0,
+    "panel_relative_azimuth_deg": 0.0, "panel_misalignment_deg": 0.0,
+    "panel_efficiency_factor": 1.0, "relay_udp_to_ser_total": 0, "relay_ser_to_udp_total": 0,
+
+    # Laser Status (complete telemetry)
+    "laser_connected": False,
+    "laser_avg_power_w": 0.0,
+    "laser_peak_power_w": 0.0,
+    "laser_commanded_w": 0.0,
+    "laser_case_temperature_c": 0.0,
+    "laser_board_temperature_c": 0.0,
+    "laser_setpoint_pct": 0.0,
+    "laser_status_flags": {},
+    "laser_status_word": 0,
+    "laser_device_id": "Unknown",
+    "laser_firmware_revision": "Unknown",
+    "laser_emission_on": False,
+    "laser_power_supply_on": False,
+    "laser_alarm_critical": False,
+    "laser_alarm_overheat": False,
+    "laser_error": None,
+
+    # Legacy aliases
+    "laser_output_power_w": 0.0,
+    "laser_temperature_c": 0.0,
+}
+
+
+# slots=True stores fields in fixed slots instead of a per-instance
+# __dict__: hot attribute reads (telemetry, ws_broadcast, the ring
+# indices) skip the dict lookup
+@dataclass(slots=True)
 class SharedState:
     # WEBSOCKET BROADCAST CALLBACK
     ws_broadcast: Optional[callable] = None
 
     # PROCESS LIFECYCLE
     status: str = "DISCONNECTED"
-    process_pids: Dict[str, Optional[int]] = field(default_factory=lambda: {
-        "ground": None, "air": None, "relay": None
-    })
+    # One slot per supervised process: plain attribute stores, no dict
+    pid_ground: Optional[int] = None
+    pid_air: Optional[int] = None
+    pid_relay: Optional[int] = None
 
     # CURRENT SESSION
     session_id: Optional[str] = None
@@ -23,190 +69,215 @@ class SharedState:
     session_start_time: float = 0.0
 
     # TELEMETRY BUFFERS
-    telemetry: Dict = field(default_factory=lambda: {
-        "commanded_pct": 0, "commanded_w": 0.0, "received_mw": 0.0, "efficiency_pct": 0.0,
-        "link_quality_pct": 0, "rtt_ms": 0.0, "granted": False, "deny_reason": None,
-        "grants_total": 0, "denies_total": 0, "seq": 0, "voltage_mv": 0, "current_ma": 0,
-        "soc_pct": 0.0, "temp_cdeg": 0, "distance_m": 0.0, "roll_deg": 0.0, "pitch_deg": 0.0,
-        "yaw_deg": 0.0, "gps_lat_deg": None, "gps_lon_deg": None, "gps_alt_m": None,
-        "gps_rel_alt_m": None, "home_lat_deg": None, "home_lon_deg": None,
-        "panel_target_azimuth_deg": 0.0, "panel_target_elevation_deg": 0.0,
-        "panel_gimbal_azimuth_deg": 0.0, "panel_gimbal_elevation_deg": 0.0,
-        "panel_relative_azimuth_deg": 0.0, "panel_misalignment_deg": 0.0,
-        "panel_efficiency_factor": 1.0, "relay_udp_to_ser_total": 0, "relay_ser_to_udp_total": 0,
-        
-        # Laser Status (complete telemetry)
-        "laser_connected": False,
-        "laser_avg_power_w": 0.0,
-        "laser_peak_power_w": 0.0,
-        "laser_case_temperature_c": 0.0,
-        "laser_board_temperature_c": 0.0,
-        "laser_setpoint_pct": 0.0,
-        "laser_status_flags": {},
-        "laser_status_word": 0,
-        "laser_device_id": "Unknown",
-        "laser_firmware_revision": "Unknown",
-        "laser_emission_on": False,
-        "laser_power_supply_on": False,
-        "laser_alarm_critical": False,
-        "laser_alarm_overheat": False,
-        "laser_error": None,
-
-        # Legacy aliases
-        "laser_output_power_w": 0.0,
-        "laser_temperature_c": 0.0,
-    })
-
-    rtt_samples: Deque[float] = field(default_factory=lambda: deque(maxlen=100))
-    events: Deque[Dict] = field(default_factory=lambda: deque(maxlen=500))
+    telemetry: Dict = field(default_factory=_TELEMETRY_DEFAULTS.copy)
+
+    # RTT samples live in a preallocated float64 ring: ingestion is a
+    # single array store (no PyFloat boxing) and the percentile path
+    # reads a zero-copy view instead of copying a deque out to a list
+    _rtt_ring: np.ndarray = field(default_factory=lambda: np.empty(100, dtype=np.float64))
+    _rtt_head: int = 0
+    _rtt_count: int = 0
+    # Event history lives in a preallocated 500-slot circular list:
+    # append is a plain slot store + index bump, with none of the
+    # per-node alloc/free churn a deque pays at sustained event rates
+    _events_buf: List[Optional[Dict]] = field(default_factory=lambda: [None] * 500)
+    _events_head: int = 0
+    _events_count: int = 0
+    # Outbound event staging ring: producers append here (GIL-atomic) and
+    # one consumer task drains it in 50ms batches, so a burst of events
+    # costs a single WS broadcast instead of one fan-out per event
+    _broadcast_ring: Deque = field(default_factory=lambda: deque(maxlen=1024))
+    _broadcast_task: Optional[asyncio.Task] = field(default=None, init=False)
     errors: Deque[Dict] = field(default_factory=lambda: deque(maxlen=50))
+    # Last few ERROR messages, readable lock-free by /status
+    # (deque appends are atomic, so readers never need the state lock)
+    recent_errors: Deque[str] = field(default_factory=lambda: deque(maxlen=10))
     last_telemetry_ts: float = 0.0
     last_heartbeat_ts: float = 0.0
 
-    _lock: Optional[asyncio.Lock] = field(default=None, init=False)
+    # Zero-copy read-only view over the live telemetry dict, for readers
+    # on the event loop that only peek at a few keys and don't need the
+    # full-dict copy that get_telemetry_snapshot() pays for. Off-loop
+    # readers (e.g. the thread-pool serializer) must keep using the
+    # snapshot: the view tracks in-flight mutations.
+    telemetry_view: Mapping = field(default=None, init=False)
 
     def __post_init__(self):
-        if self._lock is None:
-            try:
-                self._lock = asyncio.Lock()
-            except RuntimeError:
-                pass
-    
-    async def _ensure_lock(self):
-        if self._lock is None or not isinstance(self._lock, asyncio.Lock):
-            self._lock = asyncio.Lock()
-        return self._lock
+        self.telemetry_view = MappingProxyType(self.telemetry)
 
     # ============================================================
     # CORE UPDATE METHODS
     # ============================================================
 
-    async def update_telemetry(self, data: Dict):
-        lock = await self._ensure_lock()
-        async with lock:
-            self.telemetry.update(data)
-            self.last_telemetry_ts = time.time()
-            if "rtt_ms" in data and data["rtt_ms"] > 0:
-                self.rtt_samples.append(data["rtt_ms"])
-
-    async def update_laser_telemetry(self, laser_data: Dict):
+    def update_telemetry(self, data: Dict):
+        # No lock: asyncio is single-threaded and there is no await
+        # between these mutations, so nothing can interleave. dict.update
+        # and deque.append are each GIL-atomic, which also covers the
+        # parser worker threads.
+        self.telemetry.update(data)
+        self.last_telemetry_ts = time.time()
+        if "rtt_ms" in data and data["rtt_ms"] > 0:
+            head = self._rtt_head
+            self._rtt_ring[head] = data["rtt_ms"]
+            self._rtt_head = (head + 1) % 100
+            if self._rtt_count < 100:
+                self._rtt_count += 1
+
+    def update_laser_telemetry(self, laser_data: Dict):
         """Update laser telemetry from laser status decoder."""
-        lock = await self._ensure_lock()
-        async with lock:
-            # Extract status_flags for convenience
-            status_flags = laser_data.get("status_flags", {})
-
-            self.telemetry.update({
-                "laser_connected": laser_data.get("connected", False),
-                "laser_avg_power_w": laser_data.get("avg_power_w", 0.0),
-                "laser_peak_power_w": laser_data.get("peak_power_w", 0.0),
-                "laser_commanded_w": laser_data.get("commanded_w", 0.0),
-                "laser_case_temperature_c": laser_data.get("case_temperature_c", 0.0),
-                "laser_board_temperature_c": laser_data.get("board_temperature_c", 0.0),
-                "laser_setpoint_pct": laser_data.get("setpoint_pct", 0.0),
-                "laser_status_flags": status_flags,
-                "laser_status_word": laser_data.get("status_word", 0),
-                "laser_device_id": laser_data.get("device_id", "Unknown"),
-                "laser_firmware_revision": laser_data.get("firmware_revision", "Unknown"),
-                "laser_emission_on": status_flags.get("emission_on", False),
-                "laser_power_supply_on": status_flags.get("power_supply_on", False),
-                "laser_alarm_critical": status_flags.get("alarm_critical", False),
-                "laser_alarm_overheat": status_flags.get("alarm_overheat", False),
-                "laser_error": laser_data.get("error"),
-
-                # Legacy aliases for backward compatibility
-                "laser_output_power_w": laser_data.get("avg_power_w", 0.0),
-                "laser_temperature_c": laser_data.get("case_temperature_c", 0.0),
-            })
-
-    async def start_session(self, session_id: str, scenario: str, params: Dict):
-        lock = await self._ensure_lock()
-        async with lock:
-            self.session_id = session_id
-            self.scenario = scenario
-            self.ramp_params = params
-            self.session_start_time = time.time()
-            
-            # Full reset including new laser keys
-            self.telemetry = {
-                "commanded_pct": 0, "commanded_w": 0.0, "received_mw": 0.0, "efficiency_pct": 0.0,
-                "link_quality_pct": 0, "rtt_ms": 0.0, "granted": False, "deny_reason": None,
-                "grants_total": 0, "denies_total": 0, "seq": 0, "voltage_mv": 0, "current_ma": 0,
-                "soc_pct": 0.0, "temp_cdeg": 0, "distance_m": 0.0, "roll_deg": 0.0, "pitch_deg": 0.0,
-                "yaw_deg": 0.0, "relay_udp_to_ser_total": 0, "relay_ser_to_udp_total": 0,
-                "laser_connected": False, "laser_avg_power_w": 0.0, "laser_peak_power_w": 0.0,
-                "laser_commanded_w": 0.0, "laser_case_temperature_c": 0.0, "laser_board_temperature_c": 0.0,
-                "laser_setpoint_pct": 0.0, "laser_status_flags": {}, "laser_status_word": 0,
-                "laser_device_id": "Unknown", "laser_firmware_revision": "Unknown",
-                "laser_emission_on": False, "laser_power_supply_on": False,
-                "laser_alarm_critical": False, "laser_alarm_overheat": False,
-                "laser_error": None, "laser_output_power_w": 0.0, "laser_temperature_c": 0.0,
-            }
-            self.events.clear()
-            self.rtt_samples.clear()
-            self.errors.clear()
+        # Lock-free like update_telemetry: one dict.update, no awaits
+        # for another loop task to interleave with
+        # Extract status_flags for convenience
+        status_flags = laser_data.get("status_flags", {})
+
+        self.telemetry.update({
+            "laser_connected": laser_data.get("connected", False),
+            "laser_avg_power_w": laser_data.get("avg_power_w", 0.0),
+            "laser_peak_power_w": laser_data.get("peak_power_w", 0.0),
+            "laser_commanded_w": laser_data.get("commanded_w", 0.0),
+            "laser_case_temperature_c": laser_data.get("case_temperature_c", 0.0),
+            "laser_board_temperature_c": laser_data.get("board_temperature_c", 0.0),
+            "laser_setpoint_pct": laser_data.get("setpoint_pct", 0.0),
+            "laser_status_flags": status_flags,
+            "laser_status_word": laser_data.get("status_word", 0),
+            "laser_device_id": laser_data.get("device_id", "Unknown"),
+            "laser_firmware_revision": laser_data.get("firmware_revision", "Unknown"),
+            "laser_emission_on": status_flags.get("emission_on", False),
+            "laser_power_supply_on": status_flags.get("power_supply_on", False),
+            "laser_alarm_critical": status_flags.get("alarm_critical", False),
+            "laser_alarm_overheat": status_flags.get("alarm_overheat", False),
+            "laser_error": laser_data.get("error"),
+
+            # Legacy aliases for backward compatibility
+            "laser_output_power_w": laser_data.get("avg_power_w", 0.0),
+            "laser_temperature_c": laser_data.get("case_temperature_c", 0.0),
+        })
+
+    def start_session(self, session_id: str, scenario: str, params: Dict):
+        # No lock: every mutation below is synchronous, so no other loop
+        # task can observe the reset half-done
+        self.session_id = session_id
+        self.scenario = scenario
+        self.ramp_params = params
+        self.session_start_time = time.time()
+
+        # Full reset from the shared template, in place so
+        # telemetry_view stays bound to the live dict
+        self.telemetry.clear()
+        self.telemetry.update(_TELEMETRY_DEFAULTS)
+        self._events_head = 0
+        self._events_count = 0
+        self._rtt_head = 0
+        self._rtt_count = 0
+        self.errors.clear()
+        self.recent_errors.clear()
 
     # ============================================================
     # ADDED METHODS
     # ============================================================
 
-    async def get_telemetry_snapshot(self) -> Dict:
-        lock = await self._ensure_lock()
-        async with lock:
-            return self.telemetry.copy()
-
-    async def add_event(self, level: str, src: str, code: str, msg: str):
-        lock = await self._ensure_lock()
-        async with lock:
-            event = {
-                "ts": int(time.time() * 1000),
-                "level": level,
-                "src": src,
-                "code": code,
-                "msg": msg[:200]
-            }
-            self.events.append(event)
-            if level in ["ERROR", "WARN"]:
-                self.errors.append(event)
-
-        if self.ws_broadcast:
+    def get_telemetry_snapshot(self) -> Dict:
+        # Lock-free: dict.copy() is a single GIL-atomic operation
+        snap = self.telemetry.copy()
+        # Fold session fields into the same snapshot so consumers get
+        # one consistent view instead of racing raw attribute reads
+        # against a mid-tick status change.
+        snap["status"] = self.status
+        snap["session_id"] = self.session_id
+        snap["scenario"] = self.scenario
+        return snap
+
+    def add_event(self, level: str, src: str, code: str, msg: str):
+        event = {
+            # Integer ns clock avoids the float multiply + truncation
+            "ts": time.time_ns() // 1_000_000,
+            "level": level,
+            "src": src,
+            "code": code,
+            # Slice only when actually over the cap; short messages (the
+            # common case) keep the original object instead of a copy
+            "msg": msg if len(msg) <= 200 else msg[:200]
+        }
+        head = self._events_head
+        self._events_buf[head] = event
+        self._events_head = (head + 1) % 500
+        if self._events_count < 500:
+            self._events_count += 1
+        if level in ["ERROR", "WARN"]:
+            self.errors.append(event)
+        if level == "ERROR":
+            self.recent_errors.append(event["msg"])
+
+        # Stage for the batch broadcaster instead of fanning out inline:
+        # event producers never touch the WS path directly
+        self._broadcast_ring.append(event)
+        if self._broadcast_task is None:
+            try:
+                self._broadcast_task = asyncio.get_running_loop().create_task(
+                    self._broadcast_worker()
+                )
+            except RuntimeError:
+                pass  # no loop yet (startup); retried on the next event
+
+    async def _broadcast_worker(self):
+        """Drain staged events every 50ms and broadcast them as one batch."""
+        while True:
+            await asyncio.sleep(0.05)
+            if not self._broadcast_ring:
+                continue
+            ws = self.ws_broadcast
+            # With nobody connected, drop the staged events without
+            # building a payload (history keeps them via _events_buf)
+            if ws is None or getattr(ws, "listener_count", 1) == 0:
+                self._broadcast_ring.clear()
+                continue
+            batch = list(self._broadcast_ring)
+            self._broadcast_ring.clear()
             try:
-                self.ws_broadcast({"type": "event", "event": event})
+                ws({"type": "events", "events": batch})
             except Exception as e:
-                print(f"[State] Failed to broadcast event: {e}")
-
-    async def get_recent_events(self, count: int = 50) -> List[Dict]:
-        lock = await self._ensure_lock()
-        async with lock:
-            return list(self.events)[-count:]
-
-    async def set_status(self, new_status: str):
-        lock = await self._ensure_lock()
-        async with lock:
-            old_status = self.status
-            self.status = new_status
-        await self.add_event("INFO", "server", "STATUS_CHANGE", f"Status changed from {old_status} to {new_status}")
-
-    async def set_process_pid(self, process_name: str, pid: Optional[int]):
-        lock = await self._ensure_lock()
-        async with lock:
-            self.process_pids[process_name] = pid
-
-    async def calculate_rtt_percentiles(self) -> tuple[float, float]:
+                print(f"[State] Failed to broadcast events: {e}")
+
+    def get_recent_events(self, count: int = 50) -> List[Dict]:
+        # Slice only the requested tail out of the ring - never the full
+        # 500 entries - so the common count=50 call copies 50 refs
+        count = min(count, self._events_count)
+        if count == 0:
+            return []
+        head = self._events_head
+        start = (head - count) % 500
+        if start < head:
+            return self._events_buf[start:head]
+        # Tail wraps around the end of the buffer
+        return self._events_buf[start:] + self._events_buf[:head]
+
+    def set_status(self, new_status: str):
+        old_status = self.status
+        self.status = new_status
+        self.add_event("INFO", "server", "STATUS_CHANGE", f"Status changed from {old_status} to {new_status}")
+
+    def set_process_pid(self, process_name: str, pid: Optional[int]):
+        setattr(self, f"pid_{process_name}", pid)
+
+    def calculate_rtt_percentiles(self) -> tuple[float, float]:
         # No lock needed for reading – eventual consistency is fine
-        if len(self.rtt_samples) < 10:
+        n = self._rtt_count
+        if n < 10:
             return 0.0, 0.0
-        samples = np.array(list(self.rtt_samples))
-        p95 = np.percentile(samples, 95)
-        p99 = np.percentile(samples, 99)
-        return float(p95), float(p99)
-
-    async def get_session_duration(self) -> float:
-        lock = await self._ensure_lock()
-        async with lock:
-            if self.session_start_time == 0.0:
-                return 0.0
-            return time.time() - self.session_start_time
+        # Zero-copy view of the filled part of the ring (order doesn't
+        # matter for order statistics); one O(n) partition extracts both
+        # quantiles instead of two full percentile sorts
+        arr = self._rtt_ring[:n]
+        i95 = int(n * 0.95) - 1
+        i99 = int(n * 0.99) - 1
+        part = np.partition(arr, (i95, i99))
+        return float(part[i95]), float(part[i99])
+
+    def get_session_duration(self) -> float:
+        start = self.session_start_time
+        if start == 0.0:
+            return 0.0
+        return time.time() - start
 
 # Singleton instance
 state = SharedState()
@@ -214,65 +285,13 @@ state = SharedState()
 # ============================================================
 # PANEL GIMBAL TRACKING CALCULATIONS
 # ============================================================
-
-def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate bearing from point 1 to point 2 in degrees (0-360°)"""
-    import math
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    dlon_rad = math.radians(lon2 - lon1)
-    y = math.sin(dlon_rad) * math.cos(lat2_rad)
-    x = math.cos(lat1_rad) * math.sin(lat2_rad) - math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon_rad)
-    bearing_rad = math.atan2(y, x)
-    return (math.degrees(bearing_rad) + 360) % 360
-
-
-def calculate_horizontal_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate horizontal distance using Haversine formula (meters)"""
-    import math
-    R = 6371000.0
-    lat1_rad, lat2_rad = math.radians(lat1), math.radians(lat2)
-    dlat_rad, dlon_rad = math.radians(lat2 - lat1), math.radians(lon2 - lon1)
-    a = math.sin(dlat_rad / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon_rad / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return R * c
-
-
-def calculate_elevation_angle(horizontal_dist_m: float, altitude_diff_m: float) -> float:
-    """Calculate elevation angle"""
-    import math
-    if horizontal_dist_m < 0.1:
-        return -90.0 if altitude_diff_m > 0 else 0.0
-    return math.degrees(math.atan2(-altitude_diff_m, horizontal_dist_m))
-
-
-def calculate_panel_angles(
-    drone_lat: float, drone_lon: float, drone_alt_m: float,
-    ground_lat: float, ground_lon: float,
-    drone_yaw_deg: float, horizontal_dist_m: float,
-    drone_roll_deg: float = 0.0, drone_pitch_deg: float = 0.0
-) -> dict:
-    """Calculate 2-axis gimbal angles for panel pointing"""
-    import math
-    target_azimuth = calculate_bearing(drone_lat, drone_lon, ground_lat, ground_lon)
-    target_elevation = calculate_elevation_angle(horizontal_dist_m, drone_alt_m)
-    gimbal_azimuth_deg = target_azimuth - drone_yaw_deg
-    while gimbal_azimuth_deg > 180:
-        gimbal_azimuth_deg -= 360
-    while gimbal_azimuth_deg < -180:
-        gimbal_azimuth_deg += 360
-    GIMBAL_EL_MIN, GIMBAL_EL_MAX = -45.0, 45.0
-    actual_elevation_deg = max(GIMBAL_EL_MIN, min(GIMBAL_EL_MAX, target_elevation))
-    gimbal_limited = actual_elevation_deg != target_elevation
-    misalignment_deg = abs(target_elevation - actual_elevation_deg) if gimbal_limited else 0.0
-    efficiency_factor = max(0.0, math.cos(math.radians(misalignment_deg)))
-    return {
-        "panel_target_azimuth_deg": target_azimuth,
-        "panel_target_elevation_deg": target_elevation,
-        "panel_gimbal_azimuth_deg": gimbal_azimuth_deg,
-        "panel_gimbal_elevation_deg": actual_elevation_deg,
-        "panel_gimbal_limited": gimbal_limited,
-        "panel_relative_azimuth_deg": gimbal_azimuth_deg,
-        "panel_misalignment_deg": misalignment_deg,
-        "panel_efficiency_factor": efficiency_factor,
-    }
+# Moved to backend/geo_kernels.py so they can be numba-compiled;
+# re-exported here for existing callers.
+
+from backend.geo_kernels import (  # noqa: E402
+    calculate_bearing,
+    calculate_bearing_and_distance,
+    calculate_horizontal_distance,
+    calculate_elevation_angle,
+    calculate_panel_angles,
+)
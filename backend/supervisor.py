@@ -1,13 +1,14 @@
 import asyncio
-import subprocess
+import codecs
+import logging
+import logging.handlers
 import os
+import queue
 import signal
 from pathlib import Path
 from typing import Optional, Dict
-from datetime import datetime
 import time
 import sys
-import shutil
 import json
 import contextlib
 
@@ -17,6 +18,21 @@ from backend.parsers import GroundParser, AirParser, RelayParser
 from backend.state import state
 from .px4_control import PX4Controller
 
+logger = logging.getLogger(__name__)
+
+# Child stdout can burst at hundreds of lines/sec; route the per-line echo
+# through a QueueHandler so the monitor loop only pays a queue.put and the
+# actual terminal write happens on the listener thread. Records are emitted
+# at DEBUG, so with DEBUG off the whole path collapses to one level check.
+_log_queue: queue.Queue = queue.Queue(-1)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+logger.propagate = False
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout)
+)
+_log_listener.start()
+
 
 """
 PURPOSE: Manage lifecycle of Ground, Air, and Relay processes
@@ -40,8 +56,9 @@ class ProcessSupervisor:
     Manages Ground, Air, and Relay subprocesses
     """
     def __init__(self):
-        # Process handles
-        self.processes: Dict[str, Optional[subprocess.Popen]] = {
+        # Process handles (asyncio subprocesses: stdout reads are driven
+        # by the event loop's selector, no thread-pool readline hops)
+        self.processes: Dict[str, Optional[asyncio.subprocess.Process]] = {
             "ground": None,
             "air": None,
             "relay": None,
@@ -55,8 +72,23 @@ class ProcessSupervisor:
             "relay": RelayParser()
         }
 
-        # Background monitoring tasks
-        self._monitor_tasks: list[asyncio.Task] = []
+        # Background monitoring tasks live in one TaskGroup, owned by a
+        # runner task so stop_all cancels them all with a single cancel
+        self._monitor_tg: Optional[asyncio.TaskGroup] = None
+        self._monitor_runner: Optional[asyncio.Task] = None
+
+        # Per-process readiness events, re-armed on every spawn; set by
+        # _monitor_process when the child's _READY_MARKERS line appears
+        self._ready: Dict[str, asyncio.Event] = {}
+
+        # Holds the detached ground-crash teardown task (keeps it
+        # referenced so it can't be garbage-collected mid-flight)
+        self._crash_task: Optional[asyncio.Task] = None
+
+        # socat has no stdout monitor to own its liveness the way
+        # ground/air/relay do; this waiter clears its slot if the
+        # bridge dies on its own
+        self._socat_watcher: Optional[asyncio.Task] = None
 
         # Current session ID
         self.session_id: Optional[str] = None
@@ -64,6 +96,19 @@ class ProcessSupervisor:
         # Flag fro graceful shutdown
         self._shutting_down = False
 
+        # Live process count, kept in sync by _set_proc() so /health can
+        # read it without rebuilding a status dict per probe
+        self.running_count = 0
+
+        # Environment shared by all three children, captured once
+        # instead of os.environ.copy() per start
+        self._base_env = dict(os.environ)
+        self._base_env.update({
+            "MAVLINK20": "1",
+            "MAVLINK_DIALECT": "laser_safety",
+            "PYTHONUNBUFFERED": "1",
+        })
+
         self.ws_broadcast = lambda payload: None  # set by main.py
         self.px4 = PX4Controller()
 
@@ -71,6 +116,15 @@ class ProcessSupervisor:
         self.px4.on_status = self._on_px4_status
         
 
+    def _set_proc(self, name: str, proc):
+        """Assign self.processes[name] and keep running_count in sync."""
+        old = self.processes.get(name)
+        if old is None and proc is not None:
+            self.running_count += 1
+        elif old is not None and proc is None:
+            self.running_count -= 1
+        self.processes[name] = proc
+
     # --------------------------------------------------------------------------------
     # Optional: PX4 Integration
     # --------------------------------------------------------------------------------
@@ -92,62 +146,116 @@ class ProcessSupervisor:
     async def px4_land(self):
         await self.px4.land()
 
+    async def _land_and_wait(self, settle_s: float):
+        """Command PX4 to land, then allow time for touchdown."""
+        await self.px4_land()
+        await asyncio.sleep(settle_s)
+
+    async def _crash_teardown(self):
+        """
+        Ground crashed mid-experiment: land the drone and tear down
+        Air/Relay/socat. Landing is PX4-side and teardown is local
+        process signalling, so they run concurrently - crash cleanup
+        costs max(land, stop) instead of their sum (the old sequential
+        path held air/relay alive through the full 5s landing wait).
+        """
+        try:
+            land_task = asyncio.create_task(self._land_and_wait(5.0))
+            await self.stop_all()  # Clean up Air/Relay/socat
+            await land_task
+        except Exception as e:
+            print(f"[supervisor] Auto-land failed: {e}")
+            state.add_event(
+                "ERROR", "server", "LAND_FAILED",
+                f"Failed to land drone: {e}"
+            )
+        state.set_status("SAFE")
+
     # ==============================================================================
     # CLEANUP OLD PROCESSES
     # ==============================================================================
 
+    # Script names identifying stale experiment processes
+    _PROCESS_PATTERNS = (
+        "mav_relay.py",
+        "permit_air_power_ramp.py",
+        "permit_ground_power_ramp.py",
+    )
+
+    # First stdout line that proves each child is actually up and
+    # serving; _monitor_process flips the per-process ready event when
+    # it sees the marker, and start_all waits on that instead of
+    # sleeping a fixed init delay.
+    _READY_MARKERS = {
+        "relay": "Links up",
+        "air": "RX loop starting",
+        "ground": "Preflight:",
+    }
+
+    @staticmethod
+    def _find_pids_by_pattern(patterns: tuple) -> list:
+        """
+        Scan /proc for processes whose cmdline contains any pattern.
+
+        One listdir plus a tiny read per PID - no pgrep/pkill forks, no
+        shell-utility startup, and never matches our own process.
+        """
+        needles = tuple(p.encode() for p in patterns)
+        own_pid = os.getpid()
+        matches = []
+        try:
+            entries = os.listdir("/proc")
+        except OSError:
+            # No procfs on this platform; nothing we can find
+            print("[supervisor] Warning: /proc not available, cannot scan for stale processes")
+            return matches
+        for entry in entries:
+            if not entry.isdigit():
+                continue
+            pid = int(entry)
+            if pid == own_pid:
+                continue
+            try:
+                with open(f"/proc/{pid}/cmdline", "rb") as f:
+                    cmd = f.read()
+            except OSError:
+                continue  # process vanished mid-scan
+            if not any(n in cmd for n in needles):
+                continue
+            # Skip our own live children: those are managed through
+            # stop_* and must not be reaped behind the supervisor's back
+            try:
+                with open(f"/proc/{pid}/stat", "rb") as f:
+                    # Field 4 (after the parenthesised comm) is the ppid
+                    ppid = int(f.read().rpartition(b")")[2].split()[1])
+            except (OSError, ValueError, IndexError):
+                ppid = -1
+            if ppid == own_pid:
+                continue
+            matches.append(pid)
+        return matches
+
     async def _cleanup_old_processes(self):
         """
         Kill any existing laser power beaming processes before starting new ones.
         Prevents port conflicts and zombie processes.
         """
-        process_patterns = [
-            "mav_relay.py",
-            "permit_air_power_ramp.py",
-            "permit_ground_power_ramp.py"
-        ]
-
         killed_any = False
 
-        for pattern in process_patterns:
+        for pid in self._find_pids_by_pattern(self._PROCESS_PATTERNS):
             try:
-                # Find PIDs of matching processes
-                result = subprocess.run(
-                    ["pgrep", "-f", pattern],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
+                print(f"[supervisor] Cleaning up old process (PID {pid})")
+                os.kill(pid, signal.SIGTERM)
+                killed_any = True
+                state.add_event(
+                    "INFO", "supervisor", "CLEANUP",
+                    f"Killed stale process (PID {pid})"
                 )
-
-                if result.returncode == 0 and result.stdout.strip():
-                    pids = result.stdout.strip().split('\n')
-                    for pid_str in pids:
-                        if pid_str:
-                            try:
-                                pid = int(pid_str)
-                                # Don't kill our own process
-                                if pid != os.getpid():
-                                    print(f"[supervisor] Cleaning up old process: {pattern} (PID {pid})")
-                                    os.kill(pid, signal.SIGTERM)
-                                    killed_any = True
-                                    await state.add_event(
-                                        "INFO", "supervisor", "CLEANUP",
-                                        f"Killed stale process: {pattern} (PID {pid})"
-                                    )
-                            except (ProcessLookupError, ValueError):
-                                # Process already dead or invalid PID
-                                pass
-                            except Exception as e:
-                                print(f"[supervisor] Failed to kill PID {pid_str}: {e}")
-
-            except subprocess.TimeoutExpired:
-                print(f"[supervisor] Timeout checking for {pattern}")
-            except FileNotFoundError:
-                # pgrep not available on this system
-                print("[supervisor] Warning: pgrep not available, cannot cleanup old processes")
-                break
+            except ProcessLookupError:
+                # Process already dead
+                pass
             except Exception as e:
-                print(f"[supervisor] Cleanup error for {pattern}: {e}")
+                print(f"[supervisor] Failed to kill PID {pid}: {e}")
 
         if killed_any:
             # Wait for ports to be released
@@ -165,21 +273,18 @@ class ProcessSupervisor:
         1) the event log
         2) live WS updates (if hooked from main.py)
         """
-        # 1) event log (async): don't block caller
-        async def _log():
-            try:
-                # compact message
-                msg = json.dumps(kv, separators=(",",":"))
-                await state.add_event("INFO", "PX4", phase, msg)
-            except Exception:
-                pass
+        # 1) event log - add_event is sync and lock-free, so log inline
+        # instead of paying a Task allocation per status change
+        try:
+            msg = json.dumps(kv, separators=(",", ":"))  # compact message
+            state.add_event("INFO", "PX4", phase, msg)
+        except Exception:
+            pass
 
         if phase == "PX4_CONNECTED":
-            asyncio.create_task(state.set_status("READY"))
+            state.set_status("READY")
         elif phase == "PX4_DISCONNECTED":
-            asyncio.create_task(state.set_status("SAFE"))
-            
-        asyncio.create_task(_log())
+            state.set_status("SAFE")
 
         # 2) live WS broadcast (fire-and-forget)
         with contextlib.suppress(Exception):
@@ -187,8 +292,12 @@ class ProcessSupervisor:
             self.ws_broadcast(payload)
 
     def is_running(self) -> bool:
+        # Liveness is owned by the monitor tasks: each one nulls its
+        # processes[] slot in its finally at stdout EOF, so a plain
+        # None-check is current to within the monitor's wakeup (no
+        # per-call returncode probing needed)
         return any(
-            self.processes[name] is not None and self.processes[name].poll() is None
+            self.processes[name] is not None
             for name in ("ground", "air", "relay")
         )
 
@@ -198,12 +307,13 @@ class ProcessSupervisor:
         Uses `socat pty,link=... pty,link=...` and keeps it running.
         """
         # If already running, nothing to do
-        if self.processes.get("socat") and self.processes["socat"].poll() is None:
+        if self.processes.get("socat") and self.processes["socat"].returncode is None:
             return
 
-        # Check socat exists
-        if not shutil.which(settings.SOCAT_BIN):
-            await state.add_event(
+        # Check socat exists (resolved once at startup in Settings;
+        # no PATH walk per experiment start)
+        if not settings.SOCAT_PATH:
+            state.add_event(
                 "ERROR", "server", "SOCAT_NOT_FOUND",
                 "socat not found. Install with: brew install socat"
             )
@@ -214,53 +324,78 @@ class ProcessSupervisor:
         tx_path = settings.ELRS_TX_LINK.split(",")[0]
         rx_path = settings.ELRS_RX_LINK.split(",")[0]
         cmd = [
-            settings.SOCAT_BIN, "-d", "-d",
+            settings.SOCAT_PATH, "-d", "-d",
             f"pty,link={tx_path},raw,echo=0,perm=0600",
             f"pty,link={rx_path},raw,echo=0,perm=0600",
         ]
 
-        # Kill any stale symlinks/devices from a previous crash
+        # Kill any stale symlinks/devices from a previous crash. Unlink
+        # directly and swallow the miss: one syscall instead of an
+        # exists() stat + remove, and no window for the file to vanish
+        # in between.
         for p in (tx_path, rx_path):
             try:
-                if os.path.exists(p):
-                    os.remove(p)
-            except Exception:
+                os.unlink(p)
+            except FileNotFoundError:
+                pass
+            except OSError:
                 pass
 
-        proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            preexec_fn=os.setsid,
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=True,
         )
-        self.processes["socat"] = proc
-        await state.add_event("INFO", "server", "SOCAT_START", f"socat PTY bridge started (PID {proc.pid})")
+        self._set_proc("socat", proc)
+        self._socat_watcher = asyncio.create_task(self._watch_socat(proc))
+        state.add_event("INFO", "server", "SOCAT_START", f"socat PTY bridge started (PID {proc.pid})")
+
+    async def _watch_socat(self, proc: asyncio.subprocess.Process):
+        """Clear the socat slot when the bridge exits on its own.
+
+        Without this, liveness queries (which are pure dict reads, see
+        is_running) would report a crashed socat as alive until the
+        next stop_all. The stop path cancels this watcher first, so an
+        orderly shutdown doesn't log a spurious crash.
+        """
+        exit_code = await proc.wait()
+        if self.processes.get("socat") is proc:
+            self._set_proc("socat", None)
+            state.add_event(
+                "ERROR", "server", "SOCAT_EXIT",
+                f"socat PTY bridge exited unexpectedly (code {exit_code})"
+            )
 
     async def _stop_virtual_elrs_link(self):
         """Stop socat PTY bridge if running, and remove links."""
         proc = self.processes.get("socat")
         if not proc:
             return
+        # Orderly stop: retire the crash watcher before signalling
+        if self._socat_watcher is not None:
+            self._socat_watcher.cancel()
+            self._socat_watcher = None
         try:
-            if proc.poll() is None:
-                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-                for _ in range(50):
-                    if proc.poll() is not None:
-                        break
-                    await asyncio.sleep(0.1)
-                if proc.poll() is None:
-                    os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
-            await state.add_event("INFO", "server", "SOCAT_STOP", "socat PTY bridge stopped")
+            if proc.returncode is None:
+                # start_new_session makes the child its own group leader,
+                # so its pgid is its pid - no getpgid syscall needed
+                os.killpg(proc.pid, signal.SIGTERM)
+                try:
+                    await asyncio.wait_for(proc.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                    await proc.wait()
+            state.add_event("INFO", "server", "SOCAT_STOP", "socat PTY bridge stopped")
         finally:
-            self.processes["socat"] = None
-            # Clean up link files
+            self._set_proc("socat", None)
+            # Clean up link files (direct unlink, see _start for rationale)
             for p in (settings.ELRS_TX_LINK.split(",")[0], settings.ELRS_RX_LINK.split(",")[0]):
                 try:
-                    if os.path.exists(p):
-                        os.remove(p)
-                except Exception:
+                    os.unlink(p)
+                except FileNotFoundError:
+                    pass
+                except OSError:
                     pass
 
     async def start_all(self, ramp_params: RampStartRequest) -> str:
@@ -275,47 +410,69 @@ class ProcessSupervisor:
         # CRITICAL: Cleanup any old processes to prevent port conflicts
         await self._cleanup_old_processes()
 
-        # Generate unique session ID
-        self.session_id = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        # Tear down any runner left from a previous experiment (a
+        # restart without an intervening stop_all would otherwise
+        # orphan it, parked forever holding its TaskGroup open)
+        if self._monitor_runner is not None:
+            self._monitor_runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._monitor_runner
+            self._monitor_runner = None
+
+        # Open the TaskGroup that will own this experiment's monitors
+        ready = asyncio.Event()
+        self._monitor_runner = asyncio.create_task(self._run_monitor_group(ready))
+        await ready.wait()
+
+        # Generate unique session ID. time.strftime over gmtime skips the
+        # datetime object construction (and utcnow() is deprecated in 3.12);
+        # the monotonic suffix disambiguates restarts within one second.
+        self.session_id = (
+            time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+            + f"_{time.monotonic_ns() & 0xFFFF:04x}"
+        )
 
         # Initialise session in state
-        await state.start_session(
+        state.start_session(
             session_id= self.session_id,
             scenario=ramp_params.scenario,
             params= ramp_params.dict()
         )
 
-        await state.set_status("CONNECTING")
+        state.set_status("CONNECTING")
 
         try:
             # Connect to PX4 first to start collecting telemetry (GPS, attitude, etc.)
-            await state.add_event("INFO", "supervisor", "PX4_CONNECTING", "Connecting to PX4...")
+            state.add_event("INFO", "supervisor", "PX4_CONNECTING", "Connecting to PX4...")
             try:
                 await self.px4_connect()
-                await state.add_event("INFO", "supervisor", "PX4_CONNECTED", "PX4 connected, telemetry streaming")
+                state.add_event("INFO", "supervisor", "PX4_CONNECTED", "PX4 connected, telemetry streaming")
             except Exception as e:
-                await state.add_event("WARN", "supervisor", "PX4_CONNECT_FAIL", f"PX4 connection failed: {e}")
+                state.add_event("WARN", "supervisor", "PX4_CONNECT_FAIL", f"PX4 connection failed: {e}")
                 # Continue anyway - GPS is optional for the experiment
 
             # Start processes in order
             await self._start_virtual_elrs_link()
 
+            # Each start waits on the child's own ready line instead of
+            # a fixed sleep, so the pipeline advances as soon as the
+            # component is actually up (previously a flat 5s of sleeps)
             await self.start_relay()
-            await asyncio.sleep(2.0)  # Give relay time to init
+            await self._wait_ready("relay")
 
             await self.start_air()
-            await asyncio.sleep(2.0)  # Give air time to init
+            await self._wait_ready("air")
 
             await self.start_ground(ramp_params)
-            await asyncio.sleep(1.0)  # Give ground time to init
+            await self._wait_ready("ground")
             
-            await state.set_status("RAMPING")
+            state.set_status("RAMPING")
 
             return self.session_id
         
         except Exception as e:
             # If any process fails to start, stop all and raise
-            await state.add_event(
+            state.add_event(
                 "ERROR", "server", "START_FAIL", f"Experiment start failed: {e}"
             )
             await self.stop_all()
@@ -339,11 +496,9 @@ class ProcessSupervisor:
         if self.processes["relay"] is not None:
             await self.stop_relay()
         
-        # Build environment variables
-        env = os.environ.copy()
-        env.update({
-            "MAVLINK20": "1",
-            "MAVLINK_DIALECT": "laser_safety",
+        # Base env plus the relay-specific delta
+        env = {
+            **self._base_env,
             "RELAY_UDP_IN": settings.RELAY_UDP_IN,
             "RELAY_UDP_OUT": settings.RELAY_UDP_OUT,
             # Relay should attach to TX end of the pair
@@ -351,35 +506,34 @@ class ProcessSupervisor:
             "DRILL_LOSS_PCT": "0.0",
             "DRILL_DELAY_MS": "0",
             "DRILL_JITTER_MS": "0",
-            "PYTHONUNBUFFERED": "1",
-        })
+        }
         
-        # Spawn process
-        proc = subprocess.Popen(
-            [sys.executable,"-u", str(settings.RELAY_SCRIPT)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,  # Merge stderr into stdout
+        # Spawn process. limit= is the StreamReader's high-water mark
+        # (default 64KiB): 1MiB lets the kernel pipe fill during output
+        # bursts so the batched read() drains more bytes per syscall.
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-u", str(settings.RELAY_SCRIPT),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,  # Merge stderr into stdout
             env=env,
-            text=True,           # Get strings, not bytes
-            bufsize=1,           # Line-buffered (get lines immediately)
-            preexec_fn=os.setsid  # Create new process group (for cleanup)
+            start_new_session=True,  # Create new process group (for cleanup)
+            limit=1 << 20,
         )
-        # Why preexec_fn=os.setsid?
-        # - Creates a new session (process group)
+        # Why start_new_session?
+        # - Creates a new session (process group), same as setsid
         # - Allows killing entire process tree later
         # - Without it: killing parent doesn't kill children
         
-        self.processes["relay"] = proc
-        await state.set_process_pid("relay", proc.pid)
+        self._set_proc("relay", proc)
+        state.set_process_pid("relay", proc.pid)
         
-        await state.add_event(
+        state.add_event(
             "INFO", "relay", "PROCESS_START",
             f"MAV Relay started (PID {proc.pid})"
         )
         
         # Start monitoring stdout in background
-        task = asyncio.create_task(self._monitor_process("relay"))
-        self._monitor_tasks.append(task)
+        self._spawn_monitor("relay")
     
     async def stop_relay(self):
         """Stop Relay process gracefully"""
@@ -403,39 +557,34 @@ class ProcessSupervisor:
         if self.processes["air"] is not None:
             await self.stop_air()
         
-        env = os.environ.copy()
-        env.update({
-            "MAVLINK20": "1",
-            "MAVLINK_DIALECT": "laser_safety",
+        env = {
+            **self._base_env,
             "USE_PX4": "1",
             "PX4_TX_PORT": "14780",
             "PX4_RX_PORT": "14740",
             "SIM_SEED": "12345",
             # Air should attach to RX end of the pair
             "ELRS_SERIAL": settings.ELRS_RX_LINK,  # NEW (your air script logs this)
-            "PYTHONUNBUFFERED": "1",
-        })
+        }
         
-        proc = subprocess.Popen(
-            [sys.executable, "-u", str(settings.AIR_SCRIPT)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-u", str(settings.AIR_SCRIPT),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
             env=env,
-            text=True,
-            bufsize=1,
-            preexec_fn=os.setsid
+            start_new_session=True,
+            limit=1 << 20,  # see start_relay
         )
         
-        self.processes["air"] = proc
-        await state.set_process_pid("air", proc.pid)
+        self._set_proc("air", proc)
+        state.set_process_pid("air", proc.pid)
         
-        await state.add_event(
+        state.add_event(
             "INFO", "air", "PROCESS_START",
             f"Air node started (PID {proc.pid})"
         )
         
-        task = asyncio.create_task(self._monitor_process("air"))
-        self._monitor_tasks.append(task)
+        self._spawn_monitor("air")
     
     async def stop_air(self):
         """Stop Air process gracefully"""
@@ -462,48 +611,37 @@ class ProcessSupervisor:
         if self.processes["ground"] is not None:
             await self.stop_ground()
         
-        # Convert Pydantic model to environment variables
-        env = os.environ.copy()
-        env.update({
-            "MAVLINK20": "1",
-            "MAVLINK_DIALECT": "laser_safety",
-            # Ramp parameters
-            "MIN_POWER_PCT": str(params.min_power_pct),
-            "MAX_POWER_PCT": str(params.max_power_pct),
-            "STEP_PCT": str(params.step_pct),
-            "DWELL_TIME_S": str(params.dwell_time_s),
-            "MAX_POWER_W": str(params.max_power_w),
+        # Ramp parameters come pre-stringified from the validated model
+        env = {
+            **self._base_env,
+            **params.env_dict,
             # Session info
-            "SCENARIO_NAME": params.scenario,
             "EXPERIMENT_NAME": self.session_id,
             # Permit protocol (could come from another API endpoint)
             "PERMIT_SEND_HZ": "10.0",
             "PERMIT_TTL_MS": "300",
             "PERMIT_DUPLICATE": "false",
             "SIM_SEED": "12345",
-            "PYTHONUNBUFFERED": "1",
-        })
+        }
         
-        proc = subprocess.Popen(
-            [sys.executable, "-u", str(settings.GROUND_SCRIPT)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-u", str(settings.GROUND_SCRIPT),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
             env=env,
-            text=True,
-            bufsize=1,
-            preexec_fn=os.setsid
+            start_new_session=True,
+            limit=1 << 20,  # see start_relay
         )
         
-        self.processes["ground"] = proc
-        await state.set_process_pid("ground", proc.pid)
+        self._set_proc("ground", proc)
+        state.set_process_pid("ground", proc.pid)
         
-        await state.add_event(
+        state.add_event(
             "INFO", "ground", "PROCESS_START",
             f"Ground station started (PID {proc.pid})"
         )
         
-        task = asyncio.create_task(self._monitor_process("ground"))
-        self._monitor_tasks.append(task)
+        self._spawn_monitor("ground")
     
     async def stop_ground(self):
         """Stop Ground process gracefully"""
@@ -513,6 +651,36 @@ class ProcessSupervisor:
     # MONITORING & PARSING
     # ────────────────────────────────────────────────────────────
 
+    async def _run_monitor_group(self, ready: asyncio.Event):
+        """
+        Hold a TaskGroup open for the monitor tasks of one experiment.
+
+        Cancelling this runner cancels every monitor in a single
+        structured pass (and __aexit__ awaits their cleanup), replacing
+        the cancel-loop + gather bookkeeping over a task list.
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                self._monitor_tg = tg
+                ready.set()
+                # Stay open until stop_all cancels us; the children are
+                # added by the start_X methods
+                await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._monitor_tg = None
+
+    def _spawn_monitor(self, name: str):
+        # Fresh event per spawn so a restart never sees a stale set()
+        self._ready[name] = asyncio.Event()
+        if self._monitor_tg is not None:
+            self._monitor_tg.create_task(self._monitor_process(name))
+        else:
+            # No experiment group open (direct start_X call); the task
+            # still self-terminates at stdout EOF
+            asyncio.create_task(self._monitor_process(name))
+
     async def _monitor_process(self, name: str):
         """
         Monitor a process's stdout and parse lines.
@@ -528,156 +696,196 @@ class ProcessSupervisor:
             return
         
         parser = self.parsers[name]
-        
+        marker = self._READY_MARKERS.get(name)
+        ready = self._ready.get(name)
+
         try:
-            # Read stdout line-by-line
-            async for line in self._async_readline(proc.stdout):
-                # Skip empty lines
-                if not line:
-                    continue
-                
-                # Log to console for debugging
-                print(f"[{name}] {line}")
-                
-                # Parse line (updates state)
+            # Drain whatever bytes are ready in one wakeup and split
+            # into lines locally: a burst of 100 lines costs one selector
+            # event and one read() instead of 100 per-line awaits. The
+            # incremental decoder turns each chunk into text in a single
+            # C-level pass (and holds back split multi-byte sequences);
+            # the unterminated remainder carries over to the next chunk.
+            read = proc.stdout.read
+            decode = codecs.getincrementaldecoder("utf-8")("replace").decode
+            tail = ""
+            while True:
+                chunk = await read(65536)
+                if not chunk:
+                    break
+                lines = (tail + decode(chunk)).split("\n")
+                tail = lines[-1]
+                for raw in lines[:-1]:
+                    line = raw.strip()
+                    # Skip empty lines
+                    if not line:
+                        continue
+
+                    # Log to console for debugging (off-thread via the
+                    # module QueueListener; near-free when DEBUG is off)
+                    logger.debug("[%s] %s", name, line)
+
+                    # Flip the readiness event the first time the child's
+                    # marker shows up (then stop checking)
+                    if ready is not None and marker in line:
+                        ready.set()
+                        ready = None
+
+                    # Parse line (updates state). parse_line is a sync
+                    # enqueue, so the whole batch runs without yielding.
+                    try:
+                        parser.parse_line(line)
+                    except Exception as e:
+                        # Don't crash on parse errors
+                        state.add_event(
+                            "WARN", "server", "PARSE_ERROR",
+                            f"Failed to parse {name} line: {e}"
+                        )
+
+            # Flush a final line with no trailing newline
+            line = (tail + decode(b"", True)).strip()
+            if line:
+                logger.debug("[%s] %s", name, line)
                 try:
-                    await parser.parse_line(line)
+                    parser.parse_line(line)
                 except Exception as e:
-                    # Don't crash on parse errors
-                    await state.add_event(
+                    state.add_event(
                         "WARN", "server", "PARSE_ERROR",
                         f"Failed to parse {name} line: {e}"
                     )
-            
-            # If we get here, process has exited
-            exit_code = proc.poll()
+
+            # stdout hit EOF: the process has exited (or is about to);
+            # wait() reaps it and returns the code
+            exit_code = await proc.wait()
             
             if exit_code == 0:
                 # Clean exit
-                await state.add_event(
+                state.add_event(
                     "INFO", name, "PROCESS_EXIT",
                     f"{name} exited normally"
                 )
             else:
                 # Crash
-                await state.add_event(
+                state.add_event(
                     "ERROR", name, "PROCESS_CRASH",
                     f"{name} crashed with exit code {exit_code}"
                 )
-                # NEW: Auto-land when Ground completes
+                # Ground going down ends the experiment: land the drone
+                # and tear everything down in one pass (stop_all already
+                # covers air/relay/socat), then settle on SAFE. The
+                # previous triple if-block flipped READY->SAFE and
+                # stopped air/relay twice.
                 if name == "ground" and not self._shutting_down:
-                    await state.add_event(
+                    state.add_event(
                         "INFO", "server", "AUTO_LAND",
-                        "Ground experiment complete, initiating landing sequence"
+                        "Ground exited, initiating landing sequence"
                     )
-                    try:
-                        await self.px4_land()
-                        await asyncio.sleep(5)  # Wait for landing to complete
-                        await self.stop_all()  # Clean up Air/Relay
-                    except Exception as e:
-                        print(f"[supervisor] Auto-land failed: {e}")
-                        await state.add_event(
-                            "ERROR", "server", "LAND_FAILED",
-                            f"Failed to land drone: {e}"
-                        )
-
-                if name == "ground" and not self._shutting_down:
-                    await state.set_status("READY")
-                    # optional: auto-cleanup
-                    await self.stop_air()
-                    await self.stop_relay()
-                    await self._stop_virtual_elrs_link()
-
-                # If Ground crashes during ramp, go to SAFE
-                if name == "ground" and not self._shutting_down:
-                    await state.set_status("SAFE")
+                    # Detached on purpose: stop_all cancels the monitor
+                    # TaskGroup this task lives in, so running the
+                    # teardown inline would cancel it halfway through
+                    self._crash_task = asyncio.create_task(self._crash_teardown())
         
         except Exception as e:
-            await state.add_event(
+            state.add_event(
                 "ERROR", "server", "MONITOR_ERROR",
                 f"Error monitoring {name}: {e}"
             )
         
         finally:
-            # Cleanup
-            self.processes[name] = None
-            await state.set_process_pid(name, None)
-
-    async def _async_readline(self, stream):
-
-        """Asynchronously read lines from a stream
-        How it works:
-        1. readline() is a BLOCKING call (waits for \n)
-        2. run_in_executor() runs it in a thread pool
-        3. await yields control while waiting
-        4. Other tasks can run (WebSocket, API requests)
-        
-        Example timeline:
-        Time  Task A (readline)        Task B (WebSocket)
-        ───────────────────────────────────────────────────
-        0ms   await readline()
-        1ms     → submitted to pool
-        2ms     → waiting...           await send_telemetry()
-        3ms     → waiting...             → reading state
-        4ms     → waiting...             → serializing JSON
-        5ms     → line ready!            → sending to browser
-        6ms   ← return "  [ 45%]..."  ← done
-        
-        Both tasks make progress concurrently!       
+            # Cleanup. Release any ready-waiter too, so a child that
+            # died before its marker doesn't stall start_all for the
+            # full timeout (the crash event is already recorded).
+            if ready is not None:
+                ready.set()
+            self._set_proc(name, None)
+            state.set_process_pid(name, None)
+
+    async def _wait_ready(self, name: str, timeout: float = 5.0):
+        """
+        Block until the child's ready marker appears on stdout, bounded
+        by timeout. Replaces the fixed init sleeps: the typical wait is
+        the component's real init time, not a worst-case constant.
+        """
+        event = self._ready.get(name)
+        if event is None:
+            return
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            state.add_event(
+                "WARN", "server", "READY_TIMEOUT",
+                f"{name} did not report ready within {timeout:.0f}s; continuing"
+            )
+
+    def _signal_process(self, name: str, sig: int) -> bool:
         """
+        Fire a signal at a process group and return immediately.
 
-        loop = asyncio.get_event_loop()
-        while True:
-            line = await loop.run_in_executor(None, stream.readline)
-            if not line:
-                break
-            yield line.strip()
+        Split from the exit wait so stop_all can signal every child
+        back-to-back before waiting on any of them.
+        """
+        proc = self.processes.get(name)
+        if proc is None or proc.returncode is not None:
+            return False
+        try:
+            # Why killpg? Kills entire process group (parent + children).
+            # start_new_session made the child its own group leader, so
+            # pgid == pid and the getpgid syscall is unnecessary.
+            os.killpg(proc.pid, sig)
+            return True
+        except ProcessLookupError:
+            # Process already dead
+            return False
 
-    async def _stop_process(self, name: str):
-        proc = self.processes[name]
+    async def _await_process_exit(self, name: str, timeout: float = 5.0):
+        """Wait for a signalled process to exit; SIGKILL on timeout."""
+        proc = self.processes.get(name)
         if proc is None:
             return
-        
-        # Check if already exited
-        if proc.poll() is not None:
-            self.processes[name] = None
-            return
-        
         try:
-            # Try graceful shutdown (SIGTERM)
-            os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-            # Why killpg? Kills entire process group (parent + children)
-            
-            # Wait up to 5 seconds for graceful shutdown
-            for _ in range(50):
-                if proc.poll() is not None:
-                    # Process exited
-                    await state.add_event(
-                        "INFO", name, "PROCESS_STOP",
-                        f"{name} stopped gracefully"
-                    )
-                    self.processes[name] = None
-                    return
-                await asyncio.sleep(0.1)
-            
-            # Still alive after 5s - force kill (SIGKILL)
-            os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
-            await state.add_event(
+            # wait() resolves on SIGCHLD - no polling wakeups, and exit
+            # is detected the moment it happens rather than on a 100ms
+            # grid
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=timeout)
+                state.add_event(
+                    "INFO", name, "PROCESS_STOP",
+                    f"{name} stopped gracefully"
+                )
+                return
+            except asyncio.TimeoutError:
+                pass
+
+            # Still alive after the timeout - force kill (SIGKILL)
+            self._signal_process(name, signal.SIGKILL)
+            await proc.wait()
+            state.add_event(
                 "WARN", name, "PROCESS_KILL",
                 f"{name} force killed (did not respond to SIGTERM)"
             )
-            
-        except ProcessLookupError:
-            # Process already dead
-            pass
         except Exception as e:
-            await state.add_event(
+            state.add_event(
                 "ERROR", "server", "STOP_ERROR",
                 f"Error stopping {name}: {e}"
             )
         finally:
-            self.processes[name] = None
-            await state.set_process_pid(name, None)
+            self._set_proc(name, None)
+            state.set_process_pid(name, None)
+
+    async def _stop_process(self, name: str):
+        proc = self.processes[name]
+        if proc is None:
+            return
+
+        # Check if already exited
+        if proc.returncode is not None:
+            self._set_proc(name, None)
+            state.set_process_pid(name, None)
+            return
+
+        # Try graceful shutdown (SIGTERM), then wait
+        self._signal_process(name, signal.SIGTERM)
+        await self._await_process_exit(name)
 
     async def stop_all(self):
         """
@@ -691,46 +899,45 @@ class ProcessSupervisor:
         """
         self._shutting_down = True
 
-        await state.set_status("STOPPING")
+        state.set_status("STOPPING")
 
         # Stop PX4 offboard mode first (CRITICAL for next run)
         try:
             await self.px4_offboard_stop()
-            await state.add_event("INFO", "supervisor", "PX4_OFFBOARD_STOP", "PX4 offboard mode stopped")
+            state.add_event("INFO", "supervisor", "PX4_OFFBOARD_STOP", "PX4 offboard mode stopped")
             print("[supervisor] PX4 offboard stopped")
         except Exception as e:
             print(f"[supervisor] Failed to stop offboard: {e}")
-            await state.add_event("WARN", "supervisor", "PX4_OFFBOARD_STOP_FAIL", f"Failed to stop offboard: {e}")
-
-        # Stop in reverse order (Ground → Air → Relay)
-        await self.stop_ground()
-        await self.stop_air()
-        await self.stop_relay()
-        await self._stop_virtual_elrs_link()  # NEW
-
+            state.add_event("WARN", "supervisor", "PX4_OFFBOARD_STOP_FAIL", f"Failed to stop offboard: {e}")
+
+        # Signal every child first, then wait for them in parallel -
+        # worst-case shutdown is the slowest process, not the sum
+        for name in ("ground", "air", "relay"):
+            self._signal_process(name, signal.SIGTERM)
+        await asyncio.gather(
+            self._await_process_exit("ground"),
+            self._await_process_exit("air"),
+            self._await_process_exit("relay"),
+            self._stop_virtual_elrs_link(),
+        )
 
-        # Cancel all monitoring tasks
-        for task in self._monitor_tasks:
-            task.cancel()
 
-        # Wait for tasks to cleanup
-        await asyncio.gather(*self._monitor_tasks, return_exceptions=True)
-        self._monitor_tasks.clear()
+        # One cancel tears down the whole monitor TaskGroup and
+        # waits for its children to finish cleanup
+        if self._monitor_runner is not None:
+            self._monitor_runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._monitor_runner
+            self._monitor_runner = None
 
         # Extra cleanup: kill any lingering Python processes by name
         # This prevents "Address already in use" errors on next run
         await asyncio.sleep(0.5)  # Give processes time to exit
-        try:
-            subprocess.run(
-                ["pkill", "-f", "permit_air_power_ramp.py|permit_ground_power_ramp.py|mav_relay.py"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=2
-            )
-        except Exception:
-            pass  # pkill may fail if no processes found (expected)
+        for pid in self._find_pids_by_pattern(self._PROCESS_PATTERNS):
+            with contextlib.suppress(OSError):
+                os.kill(pid, signal.SIGTERM)
 
-        await state.set_status("READY")
+        state.set_status("READY")
         self._shutting_down = False
 
     # ════════════════════════════════════════════════════════════
@@ -745,22 +952,21 @@ class ProcessSupervisor:
             {"ground": 12345, "air": 12346, "relay": 12347}
             or {"ground": None, ...} if not running
         """
+        # Monitor-owned liveness (see is_running): dead processes have
+        # already been nulled out of the dict, so this is lookups only
         return {
-            name: proc.pid if proc and proc.poll() is None else None
+            name: proc.pid if proc is not None else None
             for name, proc in self.processes.items()
         }
 
     def is_air_running(self) -> bool:
-        p = self.processes.get("air")
-        return p is not None and p.poll() is None
+        return self.processes.get("air") is not None
 
     def is_relay_running(self) -> bool:
-        p = self.processes.get("relay")
-        return p is not None and p.poll() is None
-    
+        return self.processes.get("relay") is not None
+
     def is_ground_running(self) -> bool:
-        p = self.processes.get("ground")
-        return p is not None and p.poll() is None
+        return self.processes.get("ground") is not None
 
 
     